@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -9,8 +13,53 @@ from typing import Any
 from app.config import AppConfig, ServerConfig
 from app.ssh_runner import SSHRunner
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 
 ERROR_MARKERS = ("error", "failed", "iserror=true")
+# Markers that contain another marker ("iserror=true" contains "error") can never add a match.
+_ERROR_SCAN_MARKERS = tuple(
+    marker for marker in ERROR_MARKERS if not any(other != marker and other in marker for other in ERROR_MARKERS)
+)
+SUBAGENT_RE = re.compile(r"subagent[^a-z0-9_-]*([a-z0-9_-]+)")
+READY_SENTINEL = "__READY__"
+
+# Shared across polls so the refresh loop does not spawn a fresh thread per server every cycle.
+# Sized to the fleet (threads start lazily) so no host waits in the queue behind another
+# host's SSH call; the headroom covers calls still finishing from the previous poll.
+COLLECT_POOL_MIN_WORKERS = 8
+_collect_pool_lock = threading.Lock()
+_collect_pool: ThreadPoolExecutor | None = None
+_collect_pool_workers = 0
+
+
+def _collect_pool_for(server_count: int) -> ThreadPoolExecutor:
+    global _collect_pool, _collect_pool_workers
+    wanted = max(COLLECT_POOL_MIN_WORKERS, server_count * 2)
+    with _collect_pool_lock:
+        if _collect_pool is None or _collect_pool_workers < wanted:
+            previous = _collect_pool
+            _collect_pool = ThreadPoolExecutor(max_workers=wanted, thread_name_prefix="runtime-collect")
+            _collect_pool_workers = wanted
+            atexit.register(_collect_pool.shutdown, wait=False)
+            if previous is not None:
+                # Calls already running there finish on their own SSH timeout.
+                previous.shutdown(wait=False)
+        return _collect_pool
+
+
+# A poll stops waiting on a host this long after its collection starts, and the SSH call is
+# cut off at the same point so an overrun always counts as a failure; hosts failing
+# repeatedly are skipped for a while.
+COLLECT_DEADLINE_SECONDS = 90
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 60
+_circuit_lock = threading.Lock()
+_failure_streak: dict[str, int] = {}
+_circuit_open_until_by_server: dict[str, float] = {}
 
 
 @dataclass
@@ -27,102 +76,200 @@ class AgentRuntimeStatus:
 
 def _remote_runtime_command(window_hours: int) -> str:
     script = """python3 - <<'PY'
-import glob
 import json
 import os
 import re
 import subprocess
+import sys
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 WINDOW_HOURS = __WINDOW_HOURS__
 NOW = datetime.now(timezone.utc)
 ROOT = '/root/.openclaw/agents'
-CUT = NOW - timedelta(hours=WINDOW_HOURS)
-
-hour_keys = []
-for i in range(WINDOW_HOURS - 1, -1, -1):
-    point = (NOW - timedelta(hours=i)).replace(minute=0, second=0, microsecond=0)
-    hour_keys.append(point.strftime('%m-%d %H:00'))
-
-agent_series = {key: {'sessions': 0, 'errors': 0} for key in hour_keys}
+MARKER_CACHE_PATH = os.path.expanduser('~/.cache/clawfleet/runtime_marker_cache.json')
+CUT_TS = (NOW - timedelta(hours=WINDOW_HOURS)).timestamp()
+ERROR_MARKERS = ('error', 'failed', 'iserror=true')
+# Markers containing another marker ('iserror=true' contains 'error') can never add a match.
+SCAN_MARKERS = tuple(marker for marker in ERROR_MARKERS if not any(other != marker and other in marker for other in ERROR_MARKERS))
+SCAN_MARKERS_BYTES = tuple(marker.encode() for marker in SCAN_MARKERS)
+AGENT_RE = re.compile('agent', re.IGNORECASE)
+SUBAGENT_RE = re.compile(r'subagent[^a-z0-9_-]*([a-z0-9_-]+)')
+
+BASE = (NOW - timedelta(hours=WINDOW_HOURS - 1)).replace(minute=0, second=0, microsecond=0)
+BASE_TS = BASE.timestamp()
+
+# agent_series[i] holds [sessions, errors] for the hour starting at BASE + i hours.
+agent_series = [[0, 0] for _ in range(WINDOW_HOURS)]
 agent_rank = []
 subagent_stats = defaultdict(lambda: {'calls_24h': 0, 'errors_24h': 0, 'last_seen_at': None})
 errors = []
 
-if not os.path.isdir(ROOT):
-    errors.append(f'agents directory not found: {ROOT}')
-else:
-    for agent in sorted(os.listdir(ROOT)):
-        sessions_dir = os.path.join(ROOT, agent, 'sessions')
-        if not os.path.isdir(sessions_dir):
-            continue
-        files = sorted(glob.glob(os.path.join(sessions_dir, '*.jsonl')))
-        sessions_24h = 0
-        errors_24h = 0
-        latest_mtime = None
-        latest_session_id = None
 
-        for file_path in files:
-            try:
-                stat = os.stat(file_path)
-            except OSError as exc:
-                errors.append(f'stat failed: {file_path}: {exc}')
-                continue
+def load_marker_cache():
+    # path -> [mtime_ns, size, has_error] from the previous run; unchanged files skip the tail read.
+    try:
+        with open(MARKER_CACHE_PATH, 'r', encoding='utf-8') as fh:
+            cached = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
 
-            mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-            session_id = os.path.basename(file_path).removesuffix('.jsonl')
-            if latest_mtime is None or mtime > latest_mtime:
-                latest_mtime = mtime
-                latest_session_id = session_id
 
-            if mtime < CUT:
-                continue
+def save_marker_cache(cache):
+    tmp_path = f'{MARKER_CACHE_PATH}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(MARKER_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            json.dump(cache, fh, separators=(',', ':'))
+        os.replace(tmp_path, MARKER_CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+marker_cache = load_marker_cache()
+
+
+def scan_agent(agent):
+    sessions_dir = os.path.join(ROOT, agent, 'sessions')
+    if not os.path.isdir(sessions_dir):
+        return None
+    scan_errors = []
+    scan_cache = {}
+    series = [[0, 0] for _ in range(WINDOW_HOURS)]
+    try:
+        entries = sorted(
+            (entry for entry in os.scandir(sessions_dir) if entry.name.endswith('.jsonl') and not entry.name.startswith('.')),
+            key=lambda entry: entry.name,
+        )
+    except OSError as exc:
+        scan_errors.append(f'list failed: {sessions_dir}: {exc}')
+        return None, series, scan_errors, scan_cache
+    sessions_24h = 0
+    errors_24h = 0
+    latest_ts = None
+    latest_session_id = None
+
+    for entry in entries:
+        file_path = entry.path
+        try:
+            # Still one stat() syscall per file on Linux (scandir only caches d_type);
+            # out-of-window files stop here, without opening or reading them.
+            stat = entry.stat()
+        except OSError as exc:
+            scan_errors.append(f'stat failed: {file_path}: {exc}')
+            continue
 
-            sessions_24h += 1
-            bucket = mtime.replace(minute=0, second=0, microsecond=0).strftime('%m-%d %H:00')
-            if bucket in agent_series:
-                agent_series[bucket]['sessions'] += 1
+        mtime_ts = stat.st_mtime
+        if latest_ts is None or mtime_ts > latest_ts:
+            latest_ts = mtime_ts
+            latest_session_id = entry.name.removesuffix('.jsonl')
+
+        if mtime_ts < CUT_TS:
+            continue
 
+        sessions_24h += 1
+        bucket = int((mtime_ts - BASE_TS) // 3600)
+        in_window = 0 <= bucket < WINDOW_HOURS
+        if in_window:
+            series[bucket][0] += 1
+
+        cached = marker_cache.get(file_path)
+        if isinstance(cached, list) and len(cached) == 3 and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            has_error = bool(cached[2])
+            scan_cache[file_path] = cached
+        else:
             has_error = False
             try:
                 with open(file_path, 'rb') as fh:
-                    fh.seek(0, os.SEEK_END)
-                    size = fh.tell()
-                    fh.seek(max(0, size - 65536), os.SEEK_SET)
-                    sample = fh.read().decode('utf-8', errors='ignore').lower()
-                    if any(marker in sample for marker in ('error', 'failed', 'iserror=true')):
+                    fh.seek(max(0, stat.st_size - 65536), os.SEEK_SET)
+                    sample = fh.read().lower()
+                    if any(marker in sample for marker in SCAN_MARKERS_BYTES):
                         has_error = True
+                scan_cache[file_path] = [stat.st_mtime_ns, stat.st_size, has_error]
             except OSError as exc:
-                errors.append(f'read failed: {file_path}: {exc}')
-
-            if has_error:
-                errors_24h += 1
-                if bucket in agent_series:
-                    agent_series[bucket]['errors'] += 1
-
-        error_rate = round((errors_24h / sessions_24h) * 100, 2) if sessions_24h else 0.0
-        agent_rank.append({
-            'agent': agent,
-            'sessions_24h': sessions_24h,
-            'errors_24h': errors_24h,
-            'error_rate': error_rate,
-            'last_active_at': latest_mtime.isoformat() if latest_mtime else None,
-            'latest_session_id': latest_session_id,
-        })
+                scan_errors.append(f'read failed: {file_path}: {exc}')
 
-try:
-    proc = subprocess.run(
-        ['journalctl', '-u', 'openclaw-gateway.service', '--since', f'{WINDOW_HOURS} hours ago', '--no-pager'],
-        capture_output=True,
+        if has_error:
+            errors_24h += 1
+            if in_window:
+                series[bucket][1] += 1
+
+    error_rate = round((errors_24h / sessions_24h) * 100, 2) if sessions_24h else 0.0
+    rank_entry = {
+        'agent': agent,
+        'sessions_24h': sessions_24h,
+        'errors_24h': errors_24h,
+        'error_rate': error_rate,
+        'last_active_at': datetime.fromtimestamp(latest_ts, tz=timezone.utc).isoformat() if latest_ts is not None else None,
+        'latest_session_id': latest_session_id,
+    }
+    return rank_entry, series, scan_errors, scan_cache
+
+
+if not os.path.isdir(ROOT):
+    errors.append(f'agents directory not found: {ROOT}')
+else:
+    agents = sorted(os.listdir(ROOT))
+    if agents:
+        # Session scans are disk-bound, so threads overlap the IO across agents.
+        with ThreadPoolExecutor(max_workers=min(32, len(agents))) as pool:
+            results = list(pool.map(scan_agent, agents))
+        # Only files seen in this run are kept, so deleted sessions age out of the cache.
+        next_marker_cache = {}
+        for result in results:
+            if result is None:
+                continue
+            rank_entry, series, scan_errors, scan_cache = result
+            errors.extend(scan_errors)
+            next_marker_cache.update(scan_cache)
+            if rank_entry is None:
+                continue
+            agent_rank.append(rank_entry)
+            for index, (sessions, session_errors) in enumerate(series):
+                agent_series[index][0] += sessions
+                agent_series[index][1] += session_errors
+        if next_marker_cache != marker_cache:
+            save_marker_cache(next_marker_cache)
+
+JOURNAL_ARGS = ['journalctl', '-u', 'openclaw-gateway.service', '--since', f'{WINDOW_HOURS} hours ago', '--no-pager']
+# Let journald drop unrelated lines before they reach this process.
+JOURNAL_FILTER = ['--grep=subagent|agent/embedded', '--case-sensitive=false']
+# stderr from a journalctl that lacks the filter options (too old, or built without PCRE).
+GREP_UNSUPPORTED_MARKERS = ('unrecognized option', 'invalid option', 'pattern matching')
+
+
+def stream_journal(argv, deadline):
+    # Stream the journal line by line so memory stays flat however chatty the gateway is.
+    proc = subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
-        timeout=25,
-        check=False,
+        errors='replace',
     )
-    if proc.returncode == 0:
-        for line in proc.stdout.splitlines():
+    timed_out = threading.Event()
+
+    def kill_journal():
+        timed_out.set()
+        proc.kill()
+
+    killer = threading.Timer(max(0.0, deadline - time.monotonic()), kill_journal)
+    killer.start()
+    try:
+        for line in proc.stdout:
+            # Every interesting line mentions "agent"; skip the rest before lowercasing.
+            if AGENT_RE.search(line) is None:
+                continue
+            line = line.rstrip('\\n')
             lower = line.lower()
-            if 'subagent' not in lower and 'agent/embedded' not in lower and 'subagent-registry' not in lower:
+            if 'subagent' not in lower and 'agent/embedded' not in lower:
                 continue
 
             name = 'unknown'
@@ -131,28 +278,51 @@ try:
             elif 'subagent-registry' in lower:
                 name = 'registry'
             else:
-                match = re.search(r'subagent[^a-z0-9_-]*([a-z0-9_-]+)', lower)
+                match = SUBAGENT_RE.search(lower)
                 if match:
                     name = match.group(1)
 
             stat = subagent_stats[name]
             stat['calls_24h'] += 1
-            if any(marker in lower for marker in ('error', 'failed', 'iserror=true')):
+            if any(marker in lower for marker in SCAN_MARKERS):
                 stat['errors_24h'] += 1
 
             ts = line[:15].strip() if len(line) >= 15 else line
             stat['last_seen_at'] = ts
-    else:
-        errors.append(f'journalctl failed: rc={proc.returncode} stderr={proc.stderr.strip()}')
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    finally:
+        killer.cancel()
+    return returncode, stderr.strip(), timed_out.is_set()
+
+
+try:
+    # Both attempts share one 25 second budget.
+    journal_deadline = time.monotonic() + 25
+    returncode, stderr, timed_out = stream_journal(JOURNAL_ARGS + JOURNAL_FILTER, journal_deadline)
+    if returncode == 1 and not stderr and not timed_out:
+        # journalctl exits 1 when --grep matched nothing.
+        returncode = 0
+    elif returncode != 0 and not timed_out and any(marker in stderr.lower() for marker in GREP_UNSUPPORTED_MARKERS):
+        # Older or PCRE-less journalctl rejects --grep; fall back to filtering here.
+        subagent_stats.clear()
+        returncode, stderr, timed_out = stream_journal(JOURNAL_ARGS, journal_deadline)
+    if timed_out:
+        subagent_stats.clear()
+        errors.append('journalctl error: timed out after 25 seconds')
+    elif returncode != 0:
+        subagent_stats.clear()
+        errors.append(f'journalctl failed: rc={returncode} stderr={stderr}')
 except Exception as exc:
+    subagent_stats.clear()
     errors.append(f'journalctl error: {exc}')
 
 agent_timeseries = []
-for key in hour_keys:
+for index, (sessions, session_errors) in enumerate(agent_series):
     agent_timeseries.append({
-        'hour': key,
-        'sessions': agent_series[key]['sessions'],
-        'errors': agent_series[key]['errors'],
+        'hour': (BASE + timedelta(hours=index)).strftime('%m-%d %H:00'),
+        'sessions': sessions,
+        'errors': session_errors,
     })
 
 agent_rank.sort(key=lambda item: (-item['sessions_24h'], item['agent']))
@@ -169,20 +339,27 @@ subagent_rank = sorted(
     key=lambda item: (-item['calls_24h'], item['subagent'])
 )
 
-print(json.dumps({
+result = {
     'window_hours': WINDOW_HOURS,
     'generated_at': NOW.isoformat(),
     'agent_timeseries': agent_timeseries,
     'agent_rank': agent_rank,
     'subagent_rank': subagent_rank,
     'errors': errors,
-}))
+}
+# Compact output keeps the SSH transfer small; orjson is used when the host has it.
+try:
+    import orjson
+except ImportError:
+    print(json.dumps(result, separators=(',', ':')))
+else:
+    sys.stdout.buffer.write(orjson.dumps(result) + b'\\n')
 PY"""
     return script.replace("__WINDOW_HOURS__", str(int(window_hours)))
 
 
 def parse_runtime_payload(raw_json: str, server: ServerConfig, window_hours: int) -> AgentRuntimeStatus:
-    payload = json.loads(raw_json)
+    payload = orjson.loads(raw_json) if orjson is not None else json.loads(raw_json)
     return AgentRuntimeStatus(
         server_name=server.name,
         ssh_host=server.ssh_host,
@@ -195,51 +372,86 @@ def parse_runtime_payload(raw_json: str, server: ServerConfig, window_hours: int
     )
 
 
+def _failed_status(server: ServerConfig, window_hours: int, generated_at: str, error: str) -> AgentRuntimeStatus:
+    return AgentRuntimeStatus(
+        server_name=server.name,
+        ssh_host=server.ssh_host,
+        generated_at=generated_at,
+        window_hours=window_hours,
+        agent_timeseries=[],
+        agent_rank=[],
+        subagent_rank=[],
+        errors=[error],
+    )
+
+
+def _status_dict(status: AgentRuntimeStatus) -> dict[str, Any]:
+    return {
+        "server_name": status.server_name,
+        "ssh_host": status.ssh_host,
+        "generated_at": status.generated_at,
+        "window_hours": status.window_hours,
+        "agent_timeseries": status.agent_timeseries,
+        "agent_rank": status.agent_rank,
+        "subagent_rank": status.subagent_rank,
+        "errors": status.errors,
+    }
+
+
+def _circuit_open_until(server_name: str) -> float | None:
+    with _circuit_lock:
+        until = _circuit_open_until_by_server.get(server_name)
+    if until is None or time.monotonic() >= until:
+        return None
+    return until
+
+
+def _record_collect_result(server_name: str, ok: bool) -> None:
+    with _circuit_lock:
+        if ok:
+            _failure_streak.pop(server_name, None)
+            _circuit_open_until_by_server.pop(server_name, None)
+            return
+        streak = _failure_streak.get(server_name, 0) + 1
+        _failure_streak[server_name] = streak
+        if streak >= CIRCUIT_FAILURE_THRESHOLD:
+            _circuit_open_until_by_server[server_name] = time.monotonic() + CIRCUIT_COOLDOWN_SECONDS
+
+
 def collect_server_agent_runtime(
     runner: SSHRunner,
     server: ServerConfig,
     window_hours: int = 24,
 ) -> AgentRuntimeStatus:
     now = datetime.now(timezone.utc).isoformat()
-    ping = runner.run_ssh(server.ssh_host, "echo ok", timeout=10)
-    if ping.returncode != 0 or ping.stdout.strip() != "ok":
-        return AgentRuntimeStatus(
-            server_name=server.name,
-            ssh_host=server.ssh_host,
-            generated_at=now,
-            window_hours=window_hours,
-            agent_timeseries=[],
-            agent_rank=[],
-            subagent_rank=[],
-            errors=[ping.stderr.strip() or "SSH not reachable"],
+    open_until = _circuit_open_until(server.name)
+    if open_until is not None:
+        remaining = int(open_until - time.monotonic()) + 1
+        return _failed_status(
+            server,
+            window_hours,
+            now,
+            f"skipped after {CIRCUIT_FAILURE_THRESHOLD} consecutive failures; retry in {remaining}s",
         )
 
-    result = runner.run_ssh(server.ssh_host, _remote_runtime_command(window_hours), timeout=120)
-    if result.returncode != 0:
-        return AgentRuntimeStatus(
-            server_name=server.name,
-            ssh_host=server.ssh_host,
-            generated_at=now,
-            window_hours=window_hours,
-            agent_timeseries=[],
-            agent_rank=[],
-            subagent_rank=[],
-            errors=[result.stderr.strip() or "runtime collector failed"],
-        )
+    command = f"echo {READY_SENTINEL} && " + _remote_runtime_command(window_hours)
+    result = runner.run_ssh(server.ssh_host, command, timeout=COLLECT_DEADLINE_SECONDS)
+    _, ready, payload = result.stdout.partition(f"{READY_SENTINEL}\n")
+    if not ready or result.returncode != 0:
+        _record_collect_result(server.name, ok=False)
+        if not ready:
+            error = result.stderr.strip() or "SSH not reachable"
+        else:
+            error = result.stderr.strip() or "runtime collector failed"
+        return _failed_status(server, window_hours, now, error)
 
     try:
-        return parse_runtime_payload(result.stdout, server, window_hours)
+        status = parse_runtime_payload(payload, server, window_hours)
     except Exception as exc:
-        return AgentRuntimeStatus(
-            server_name=server.name,
-            ssh_host=server.ssh_host,
-            generated_at=now,
-            window_hours=window_hours,
-            agent_timeseries=[],
-            agent_rank=[],
-            subagent_rank=[],
-            errors=[f"parse runtime payload failed: {exc}"],
-        )
+        _record_collect_result(server.name, ok=False)
+        return _failed_status(server, window_hours, now, f"parse runtime payload failed: {exc}")
+    _record_collect_result(server.name, ok=True)
+    return status
 
 
 def collect_agent_runtime_all(config: AppConfig, runner: SSHRunner, window_hours: int = 24) -> dict[str, dict[str, Any]]:
@@ -247,38 +459,57 @@ def collect_agent_runtime_all(config: AppConfig, runner: SSHRunner, window_hours
     if not config.servers:
         return output
 
-    with ThreadPoolExecutor(max_workers=len(config.servers)) as pool:
-        futures = {
-            pool.submit(collect_server_agent_runtime, runner, server, window_hours): server
-            for server in config.servers
-        }
-        for future in as_completed(futures):
-            server = futures[future]
-            try:
-                status = future.result()
-            except Exception as exc:
-                output[server.name] = {
-                    "server_name": server.name,
-                    "ssh_host": server.ssh_host,
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "window_hours": window_hours,
-                    "agent_timeseries": [],
-                    "agent_rank": [],
-                    "subagent_rank": [],
-                    "errors": [f"future failed: {exc}"],
-                }
-                continue
+    # Each host gets COLLECT_DEADLINE_SECONDS from when its task starts running, so
+    # time spent queued in the pool is not charged to it.
+    started_at: dict[str, float] = {}
 
-            output[server.name] = {
-                "server_name": status.server_name,
-                "ssh_host": status.ssh_host,
-                "generated_at": status.generated_at,
-                "window_hours": status.window_hours,
-                "agent_timeseries": status.agent_timeseries,
-                "agent_rank": status.agent_rank,
-                "subagent_rank": status.subagent_rank,
-                "errors": status.errors,
-            }
+    def collect(server: ServerConfig) -> AgentRuntimeStatus:
+        started_at[server.name] = time.monotonic()
+        return collect_server_agent_runtime(runner, server, window_hours)
+
+    pool = _collect_pool_for(len(config.servers))
+    submitted_at = time.monotonic()
+    futures = {pool.submit(collect, server): server for server in config.servers}
+
+    def deadline(future) -> float:
+        return started_at.get(futures[future].name, submitted_at) + COLLECT_DEADLINE_SECONDS
+
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        for future in [item for item in pending if not item.done() and deadline(item) <= now]:
+            pending.discard(future)
+            server = futures[future]
+            if future.cancel():
+                error = f"runtime collection did not start within {COLLECT_DEADLINE_SECONDS}s"
+            else:
+                # Still running: the task records its own outcome once the SSH call
+                # returns, so the circuit breaker sees this attempt exactly once.
+                error = f"runtime collection exceeded {COLLECT_DEADLINE_SECONDS}s"
+            output[server.name] = _status_dict(
+                _failed_status(server, window_hours, datetime.now(timezone.utc).isoformat(), error)
+            )
+        if not pending:
+            break
+        timeout = max(0.0, min(map(deadline, pending)) - now)
+        _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+    for future, server in futures.items():
+        if server.name in output:
+            continue
+        try:
+            status = future.result()
+        except Exception as exc:
+            output[server.name] = _status_dict(
+                _failed_status(
+                    server,
+                    window_hours,
+                    datetime.now(timezone.utc).isoformat(),
+                    f"future failed: {exc}",
+                )
+            )
+            continue
+        output[server.name] = _status_dict(status)
 
     return output
 
@@ -296,9 +527,7 @@ def normalize_subagent_name(line: str) -> str:
     if "subagent-registry" in lower:
         return "registry"
     if "subagent" in lower:
-        import re
-
-        match = re.search(r"subagent[^a-z0-9_-]*([a-z0-9_-]+)", lower)
+        match = SUBAGENT_RE.search(lower)
         if match:
             return match.group(1)
     return "unknown"
@@ -306,4 +535,4 @@ def normalize_subagent_name(line: str) -> str:
 
 def is_error_line(line: str) -> bool:
     lower = line.lower()
-    return any(marker in lower for marker in ERROR_MARKERS)
+    return any(marker in lower for marker in _ERROR_SCAN_MARKERS)
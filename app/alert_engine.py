@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
-from app.config import AppConfig
+from app.config import AlertsConfig, AppConfig
 from app.fleet_aggregator import parse_disk_usage_percent, parse_runtime_summary
 
 DEFAULT_RULES: list[dict[str, Any]] = [
@@ -17,11 +18,21 @@ DEFAULT_RULES: list[dict[str, Any]] = [
 RULE_TYPES = {"gateway_inactive", "unreachable", "disk_usage_percent", "agent_error_rate"}
 SEVERITIES = {"critical", "warning", "info"}
 
+# Coerced rules for the most recently seen AlertsConfig; reload_config swaps in a new object.
+_rules_cache: tuple[AlertsConfig, list[dict[str, Any]]] | None = None
+
 
 def _coerce_rules(config: AppConfig) -> list[dict[str, Any]]:
+    global _rules_cache
+    cached = _rules_cache
+    if cached is not None and cached[0] is config.alerts:
+        return cached[1]
     if config.alerts.rules:
-        return [dict(rule) for rule in config.alerts.rules if isinstance(rule, dict)]
-    return [dict(rule) for rule in DEFAULT_RULES]
+        rules = [dict(rule) for rule in config.alerts.rules if isinstance(rule, dict)]
+    else:
+        rules = [dict(rule) for rule in DEFAULT_RULES]
+    _rules_cache = (config.alerts, rules)
+    return rules
 
 
 def _rule_targets(rule: dict[str, Any], server_name: str) -> bool:
@@ -35,7 +46,73 @@ def _rule_targets(rule: dict[str, Any], server_name: str) -> bool:
 
 def _event_id(server_name: str, rule_name: str, message: str) -> str:
     value = f"{server_name}|{rule_name}|{message}".encode("utf-8")
-    return hashlib.sha1(value).hexdigest()[:16]
+    return hashlib.blake2b(value, digest_size=8).hexdigest()
+
+
+@dataclass
+class _ServerMetrics:
+    status_entry: dict[str, Any]
+    details: dict[str, Any]
+    sessions_24h: int
+    errors_24h: int
+    error_rate_24h: float
+    highest_disk_usage: int | None
+
+
+# (matched, message, observed value, effective threshold)
+RuleResult = tuple[bool, str, float | int | None, Any]
+RuleHandler = Callable[[_ServerMetrics, Any], RuleResult]
+
+
+def _highest_disk_usage(details: dict[str, Any]) -> int | None:
+    highest = None
+    for key, raw in details.items():
+        if not key.startswith("disk_"):
+            continue
+        usage = parse_disk_usage_percent(str(raw))
+        if usage is None:
+            continue
+        if highest is None or usage > highest:
+            highest = usage
+    return highest
+
+
+def _rule_unreachable(metrics: _ServerMetrics, threshold: Any) -> RuleResult:
+    matched = not bool(metrics.status_entry.get("reachable"))
+    return matched, "SSH unreachable" if matched else "", None, threshold
+
+
+def _rule_gateway_inactive(metrics: _ServerMetrics, threshold: Any) -> RuleResult:
+    details = metrics.details
+    matched = bool(metrics.status_entry.get("reachable")) and details.get("gateway_status") != "active"
+    message = f"Gateway status is {details.get('gateway_status', 'unknown')}" if matched else ""
+    return matched, message, None, threshold
+
+
+def _rule_disk_usage_percent(metrics: _ServerMetrics, threshold: Any) -> RuleResult:
+    limit = int(threshold if threshold is not None else 85)
+    highest = metrics.highest_disk_usage
+    if highest is None:
+        return False, "", None, limit
+    matched = highest >= limit
+    message = f"Disk usage high: {highest}% >= {limit}%" if matched else ""
+    return matched, message, highest, limit
+
+
+def _rule_agent_error_rate(metrics: _ServerMetrics, threshold: Any) -> RuleResult:
+    limit = float(threshold if threshold is not None else 30)
+    error_rate_24h = metrics.error_rate_24h
+    matched = metrics.sessions_24h > 0 and error_rate_24h >= limit
+    message = f"Agent error rate high: {error_rate_24h}% >= {limit}%" if matched else ""
+    return matched, message, error_rate_24h, limit
+
+
+RULE_HANDLERS: dict[str, RuleHandler] = {
+    "unreachable": _rule_unreachable,
+    "gateway_inactive": _rule_gateway_inactive,
+    "disk_usage_percent": _rule_disk_usage_percent,
+    "agent_error_rate": _rule_agent_error_rate,
+}
 
 
 def evaluate_alerts(config: AppConfig, status_cache: dict[str, Any], runtime_cache: dict[str, Any]) -> dict[str, Any]:
@@ -45,6 +122,20 @@ def evaluate_alerts(config: AppConfig, status_cache: dict[str, Any], runtime_cac
     rules = _coerce_rules(config)
     events: list[dict[str, Any]] = []
 
+    active_rules: list[tuple[dict[str, Any], str, str, str]] = []
+    for rule in rules:
+        rule_type = str(rule.get("type", ""))
+        severity = str(rule.get("severity", "warning"))
+        if rule_type not in RULE_TYPES or severity not in SEVERITIES:
+            continue
+        rule_name = str(rule.get("name", rule.get("type", "unnamed-rule")))
+        active_rules.append((rule, rule_name, rule_type, severity))
+    rules_by_server = {
+        server.name: [item for item in active_rules if _rule_targets(item[0], server.name)]
+        for server in config.servers
+        if server.enabled
+    }
+
     for server in config.servers:
         if not server.enabled:
             continue
@@ -52,53 +143,17 @@ def evaluate_alerts(config: AppConfig, status_cache: dict[str, Any], runtime_cac
         details = status_entry.get("details", {}) if isinstance(status_entry, dict) else {}
         runtime_entry = runtime_servers.get(server.name, {}) if isinstance(runtime_servers, dict) else {}
         sessions_24h, errors_24h, error_rate_24h = parse_runtime_summary(runtime_entry)
+        metrics = _ServerMetrics(
+            status_entry=status_entry,
+            details=details,
+            sessions_24h=sessions_24h,
+            errors_24h=errors_24h,
+            error_rate_24h=error_rate_24h,
+            highest_disk_usage=_highest_disk_usage(details),
+        )
 
-        for rule in rules:
-            if not _rule_targets(rule, server.name):
-                continue
-            rule_name = str(rule.get("name", rule.get("type", "unnamed-rule")))
-            rule_type = str(rule.get("type", ""))
-            severity = str(rule.get("severity", "warning"))
-            if rule_type not in RULE_TYPES or severity not in SEVERITIES:
-                continue
-
-            matched = False
-            message = ""
-            value: float | int | None = None
-            threshold = rule.get("threshold")
-
-            if rule_type == "unreachable":
-                matched = not bool(status_entry.get("reachable"))
-                if matched:
-                    message = "SSH unreachable"
-            elif rule_type == "gateway_inactive":
-                matched = bool(status_entry.get("reachable")) and details.get("gateway_status") != "active"
-                if matched:
-                    message = f"Gateway status is {details.get('gateway_status', 'unknown')}"
-            elif rule_type == "disk_usage_percent":
-                limit = int(threshold if threshold is not None else 85)
-                highest = None
-                for key, raw in details.items():
-                    if not key.startswith("disk_"):
-                        continue
-                    usage = parse_disk_usage_percent(str(raw))
-                    if usage is None:
-                        continue
-                    if highest is None or usage > highest:
-                        highest = usage
-                if highest is not None:
-                    value = highest
-                    matched = highest >= limit
-                    if matched:
-                        message = f"Disk usage high: {highest}% >= {limit}%"
-                threshold = limit
-            elif rule_type == "agent_error_rate":
-                limit = float(threshold if threshold is not None else 30)
-                value = error_rate_24h
-                matched = sessions_24h > 0 and error_rate_24h >= limit
-                if matched:
-                    message = f"Agent error rate high: {error_rate_24h}% >= {limit}%"
-                threshold = limit
+        for rule, rule_name, rule_type, severity in rules_by_server[server.name]:
+            matched, message, value, threshold = RULE_HANDLERS[rule_type](metrics, rule.get("threshold"))
 
             if matched:
                 events.append(
@@ -115,15 +170,10 @@ def evaluate_alerts(config: AppConfig, status_cache: dict[str, Any], runtime_cac
                     }
                 )
 
-    summary = {
-        "total": len(events),
-        "critical": len([row for row in events if row["severity"] == "critical"]),
-        "warning": len([row for row in events if row["severity"] == "warning"]),
-        "info": len([row for row in events if row["severity"] == "info"]),
-        "by_server": {},
-    }
+    summary: dict[str, Any] = {"total": len(events), "critical": 0, "warning": 0, "info": 0}
     by_server: dict[str, int] = {}
     for event in events:
+        summary[event["severity"]] += 1
         by_server[event["server"]] = by_server.get(event["server"], 0) + 1
     summary["by_server"] = by_server
     return {"generated_at": generated_at, "rules": rules, "events": events, "summary": summary}
@@ -6,6 +6,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class ConfigError(RuntimeError):
     pass
@@ -24,15 +29,14 @@ class ServerConfig:
 
 @dataclass
 class SyncConfig:
-    roots: list[str] = field(default_factory=lambda: ["/root/files", "/root/.openclaw/workspace"])
-    excludes: list[str] = field(
-        default_factory=lambda: [
-            "**/.env",
-            "**/credentials/**",
-            "**/openclaw.json",
-            "**/auth-profiles.json",
-            "**/.codex/**",
-        ]
+    # Tuples, so request handlers can share them without defensive copies.
+    roots: tuple[str, ...] = ("/root/files", "/root/.openclaw/workspace")
+    excludes: tuple[str, ...] = (
+        "**/.env",
+        "**/credentials/**",
+        "**/openclaw.json",
+        "**/auth-profiles.json",
+        "**/.codex/**",
     )
     allow_delete: bool = False
     ssh_key_path: str | None = "/ABS/PATH/TO/YOUR/SSH_PRIVATE_KEY"
@@ -54,6 +58,11 @@ class SecurityConfig:
     prefer_macos_biometric: bool = True
 
 
+@dataclass
+class HttpServerConfig:
+    max_workers: int = 16
+
+
 @dataclass
 class AppConfig:
     poll_interval_seconds: int
@@ -61,6 +70,7 @@ class AppConfig:
     sync: SyncConfig
     alerts: AlertsConfig = field(default_factory=AlertsConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
+    server: HttpServerConfig = field(default_factory=HttpServerConfig)
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -78,11 +88,17 @@ DEFAULT_CONFIG = AppConfig(
 
 def _merge_dict(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
     result = dict(base)
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dict(result[key], value)
-        else:
-            result[key] = value
+    # Only nested dicts that are actually overridden get copied; base is never mutated.
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(result, updates)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = dict(current)
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     return result
 
 
@@ -108,14 +124,14 @@ def _to_sync(item: Any) -> SyncConfig:
         raise ConfigError("sync must be an object")
     roots = item.get("roots", ["/root/files", "/root/.openclaw/workspace"])
     excludes = item.get("excludes", SyncConfig().excludes)
-    if not isinstance(roots, list) or not all(isinstance(row, str) for row in roots):
+    if not isinstance(roots, (list, tuple)) or not all(isinstance(row, str) for row in roots):
         raise ConfigError("sync.roots must be a list of strings")
-    if not isinstance(excludes, list) or not all(isinstance(row, str) for row in excludes):
+    if not isinstance(excludes, (list, tuple)) or not all(isinstance(row, str) for row in excludes):
         raise ConfigError("sync.excludes must be a list of strings")
 
     return SyncConfig(
-        roots=roots,
-        excludes=excludes,
+        roots=tuple(roots),
+        excludes=tuple(excludes),
         allow_delete=bool(item.get("allow_delete", False)),
         ssh_key_path=str(item["ssh_key_path"]) if item.get("ssh_key_path") else None,
     )
@@ -149,6 +165,12 @@ def _to_security(item: Any) -> SecurityConfig:
     )
 
 
+def _to_http_server(item: Any) -> HttpServerConfig:
+    if not isinstance(item, dict):
+        raise ConfigError("server must be an object")
+    return HttpServerConfig(max_workers=int(item.get("max_workers", 16)))
+
+
 def _validate(merged: dict[str, Any]) -> AppConfig:
     servers_raw = merged.get("servers")
     if not isinstance(servers_raw, list) or not servers_raw:
@@ -166,6 +188,7 @@ def _validate(merged: dict[str, Any]) -> AppConfig:
     sync = _to_sync(merged.get("sync", {}))
     alerts = _to_alerts(merged.get("alerts", {}))
     security = _to_security(merged.get("security", {}))
+    http_server = _to_http_server(merged.get("server", {}))
     poll_interval = int(merged.get("poll_interval_seconds", 5))
     if poll_interval < 1:
         raise ConfigError("poll_interval_seconds must be >= 1")
@@ -177,6 +200,8 @@ def _validate(merged: dict[str, Any]) -> AppConfig:
         raise ConfigError("security.username/password must be non-empty when auth enabled")
     if not security.operation_confirm_code.strip():
         raise ConfigError("security.operation_confirm_code must be non-empty")
+    if http_server.max_workers < 1:
+        raise ConfigError("server.max_workers must be >= 1")
 
     return AppConfig(
         poll_interval_seconds=poll_interval,
@@ -184,6 +209,7 @@ def _validate(merged: dict[str, Any]) -> AppConfig:
         sync=sync,
         alerts=alerts,
         security=security,
+        server=http_server,
     )
 
 
@@ -195,7 +221,7 @@ def load_config(project_root: Path) -> AppConfig:
     if not source_path.exists():
         return DEFAULT_CONFIG
 
-    data = yaml.safe_load(source_path.read_text()) or {}
+    data = yaml.load(source_path.read_bytes(), Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise ConfigError(f"Invalid config format in {source_path}")
 
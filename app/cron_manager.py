@@ -6,16 +6,37 @@ import os
 import re
 import shlex
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from app.config import AppConfig, ServerConfig
-from app.ssh_runner import SSHRunner
+from app.ssh_runner import CommandResult, SSHRunner
 
-TEXT_EXTENSIONS = {".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"}
+TEXT_EXTENSIONS = frozenset({".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"})
 CRON_CACHE_DIR = ".cache/cron_outputs"
 ERROR_MARKERS = ("error", "failed", "non-zero", "exit", "traceback")
+CRON_CACHE_TTL_SECONDS = 60
+REMOTE_SCRIPT_DIR = "~/.cache/clawfleet"
+_REMOTE_SCRIPT_MISSING_RC = 199
+_REDIRECT_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(?:^|\s)(?:>>|>|2>>|2>|&>)(?:\s*)(/[^\s;|&]+)",
+        r"(?:^|\s)1>>(?:\s*)(/[^\s;|&]+)",
+        r"(?:^|\s)1>(?:\s*)(/[^\s;|&]+)",
+    )
+)
+_WS_RE = re.compile(r"\s+")
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+
+# (server name, ssh host) -> (expires_at, server payload, jobs by job_id)
+_cron_cache_lock = threading.Lock()
+_cron_cache: dict[tuple[str, str], tuple[float, dict[str, Any], dict[str, dict[str, Any]]]] = {}
 
 
 def build_job_id(source: str, schedule: str, command: str, user: str | None) -> str:
@@ -23,30 +44,21 @@ def build_job_id(source: str, schedule: str, command: str, user: str | None) ->
     return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
 
 
-def _extract_redirect_paths(command: str) -> list[str]:
-    candidates: list[str] = []
-    patterns = [
-        r"(?:^|\s)(?:>>|>|2>>|2>|&>)(?:\s*)(/[^\s;|&]+)",
-        r"(?:^|\s)1>>(?:\s*)(/[^\s;|&]+)",
-        r"(?:^|\s)1>(?:\s*)(/[^\s;|&]+)",
-    ]
-    for pattern in patterns:
-        for match in re.finditer(pattern, command):
-            path = match.group(1).strip().strip("'\"")
-            if path.startswith("/"):
-                candidates.append(path)
-    unique: list[str] = []
-    seen: set[str] = set()
-    for item in candidates:
-        if item in seen:
-            continue
-        seen.add(item)
-        unique.append(item)
-    return unique
-
-
 def extract_output_hints(command: str) -> list[str]:
-    return [path for path in _extract_redirect_paths(command) if Path(path).suffix.lower() in TEXT_EXTENSIONS]
+    hints: list[str] = []
+    seen: set[str] = set()
+    for pattern in _REDIRECT_RES:
+        for match in pattern.finditer(command):
+            path = match.group(1).strip().strip("'\"")
+            if not path.startswith("/") or path in seen:
+                continue
+            dot = path.rfind(".")
+            # Same rule as Path.suffix: dotfiles like /var/.log have no suffix.
+            if dot <= path.rfind("/") + 1 or path[dot:].lower() not in TEXT_EXTENSIONS:
+                continue
+            seen.add(path)
+            hints.append(path)
+    return hints
 
 
 def parse_cron_lines(source: str, lines: list[str], has_user_field: bool) -> list[dict[str, Any]]:
@@ -55,7 +67,7 @@ def parse_cron_lines(source: str, lines: list[str], has_user_field: bool) -> lis
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
-        parts = re.split(r"\s+", line, maxsplit=6 if has_user_field else 5)
+        parts = _WS_RE.split(line, maxsplit=6 if has_user_field else 5)
         if not parts:
             continue
         schedule = ""
@@ -103,10 +115,11 @@ def parse_cron_lines(source: str, lines: list[str], has_user_field: bool) -> lis
     return rows
 
 
-def _job_keywords(command: str) -> list[str]:
-    tokens = [token for token in re.split(r"\s+", command) if token]
+@lru_cache(maxsize=4096)
+def _job_keywords(command: str) -> tuple[str, ...]:
+    tokens = [token for token in _WS_RE.split(command) if token]
     if not tokens:
-        return []
+        return ()
     keywords: list[str] = []
     first = os.path.basename(tokens[0].strip("'\""))
     if first:
@@ -121,7 +134,31 @@ def _job_keywords(command: str) -> list[str]:
         if item and item not in seen:
             seen.add(item)
             unique.append(item)
-    return unique
+    return tuple(unique)
+
+
+def _scan_job_lines(lines: list[str], keywords: tuple[str, ...]) -> tuple[int, int, bool | None]:
+    runs = 0
+    errors = 0
+    last_error: bool | None = None
+    # Plain for/break loops: any() over a generator costs a frame per line,
+    # which dominated this loop.
+    for line in lines:
+        low = line.lower()
+        for key in keywords:
+            if key in low:
+                break
+        else:
+            continue
+        is_error = False
+        for marker in ERROR_MARKERS:
+            if marker in low:
+                is_error = True
+                break
+        runs += 1
+        errors += is_error
+        last_error = is_error
+    return runs, errors, last_error
 
 
 def summarize_job_logs(job: dict[str, Any], log_lines_24h: list[str], log_lines_7d: list[str] | None = None) -> dict[str, Any]:
@@ -135,20 +172,19 @@ def summarize_job_logs(job: dict[str, Any], log_lines_24h: list[str], log_lines_
             "last_status": "unknown",
             "last_run_at": None,
         }
-    if log_lines_7d is None:
-        log_lines_7d = log_lines_24h
-    matches_24h = [line for line in log_lines_24h if any(key in line.lower() for key in keywords)]
-    errors_24h = [line for line in matches_24h if any(marker in line.lower() for marker in ERROR_MARKERS)]
-    matches_7d = [line for line in log_lines_7d if any(key in line.lower() for key in keywords)]
-    errors_7d = [line for line in matches_7d if any(marker in line.lower() for marker in ERROR_MARKERS)]
+    runs_24h, errors_24h, last_error = _scan_job_lines(log_lines_24h, keywords)
+    if log_lines_7d is None or log_lines_7d is log_lines_24h:
+        runs_7d, errors_7d = runs_24h, errors_24h
+    else:
+        runs_7d, errors_7d, last_error = _scan_job_lines(log_lines_7d, keywords)
     last_status = "unknown"
-    if matches_7d:
-        last_status = "error" if matches_7d[-1] in errors_7d else "ok"
+    if last_error is not None:
+        last_status = "error" if last_error else "ok"
     return {
-        "runs_24h": len(matches_24h),
-        "errors_24h": len(errors_24h),
-        "runs_7d": len(matches_7d),
-        "errors_7d": len(errors_7d),
+        "runs_24h": runs_24h,
+        "errors_24h": errors_24h,
+        "runs_7d": runs_7d,
+        "errors_7d": errors_7d,
         "last_status": last_status,
         "last_run_at": None,
     }
@@ -157,17 +193,22 @@ def summarize_job_logs(job: dict[str, Any], log_lines_24h: list[str], log_lines_
 def is_safe_output_path(remote_path: str) -> bool:
     if not remote_path or not remote_path.startswith("/"):
         return False
-    if ".." in Path(remote_path).parts:
+    if os.path.splitext(remote_path)[1].lower() not in TEXT_EXTENSIONS:
         return False
-    return Path(remote_path).suffix.lower() in TEXT_EXTENSIONS
+    return ".." not in remote_path.split("/")
+
+
+@lru_cache(maxsize=256)
+def _server_slug(server_name: str) -> str:
+    return _SLUG_RE.sub("-", server_name).strip("-") or "server"
 
 
 def build_local_output_path(project_root: Path, server_name: str, remote_path: str) -> Path:
-    server_slug = re.sub(r"[^a-zA-Z0-9_-]+", "-", server_name).strip("-") or "server"
-    suffix = Path(remote_path).suffix
+    server_slug = _server_slug(server_name)
+    suffix = os.path.splitext(remote_path)[1]
     stem = remote_path.strip("/").replace("/", "__")
     filename = f"{stem}{suffix}" if not stem.endswith(suffix) else stem
-    return project_root / CRON_CACHE_DIR / server_slug / filename
+    return project_root / f"{CRON_CACHE_DIR}/{server_slug}/{filename}"
 
 
 def _resolve_server(config: AppConfig, server: str) -> ServerConfig:
@@ -177,18 +218,123 @@ def _resolve_server(config: AppConfig, server: str) -> ServerConfig:
     return matched[0]
 
 
-def _remote_cron_list_command() -> str:
-    script = r"""python3 - <<'PY'
-import glob
+# Shared by the list and detail scripts: streams matching journal lines with a hard
+# timeout and falls back to /var/log/cron only when the journal is empty.
+_REMOTE_LOG_READER = r"""def tail_lines(path, count, block=1 << 20):
+    # Read backwards in large blocks until enough newlines are buffered,
+    # instead of spawning tail and piping its output through.
+    chunks = []
+    newlines = 0
+    with open(path, "rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= count:
+            step = min(block, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+    chunks.reverse()
+    return b"".join(chunks).decode("utf-8", "ignore").splitlines()[-count:]
+
+def open_log_stream(hours, needles):
+    journal = subprocess.Popen(
+        ["journalctl", "--since", f"{hours} hours ago", "--no-pager", "-o", "short-iso"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1 << 20,
+    )
+    # Let grep -F drop non-matching lines in C before Python sees them. It
+    # matches the whole formatted line like the scan below does, unlike
+    # journalctl --grep which only looks at MESSAGE.
+    args = ["grep", "-F", "-i"]
+    for needle in needles:
+        args.extend(["-e", needle])
+    try:
+        grep = subprocess.Popen(
+            args,
+            stdin=journal.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+            env=dict(os.environ, LC_ALL="C"),
+        )
+    except Exception:
+        return journal.stdout, [journal]
+    journal.stdout.close()
+    return grep.stdout, [journal, grep]
+
+def kill_all(procs, timed_out):
+    timed_out.set()
+    for proc in procs:
+        proc.kill()
+
+def journal_has_entries(hours):
+    try:
+        proc = subprocess.run(
+            ["journalctl", "--since", f"{hours} hours ago", "-n", "1", "-q", "--no-pager"],
+            capture_output=True, text=True, timeout=10, check=False
+        )
+    except Exception:
+        return False
+    return proc.returncode == 0 and bool(proc.stdout.strip())
+
+def read_logs(hours, fallback_lines, needles, timeout, errors):
+    # Lines are streamed from journalctl and consumed as they arrive, so the
+    # whole window never sits in memory at once.
+    seen = False
+    try:
+        stream, procs = open_log_stream(hours, needles)
+    except Exception:
+        stream, procs = None, []
+    if stream is not None:
+        timed_out = threading.Event()
+        killer = threading.Timer(timeout, kill_all, args=(procs, timed_out))
+        killer.start()
+        try:
+            for raw in stream:
+                line = raw.decode("utf-8", "replace").rstrip("\n")
+                if not line.strip():
+                    continue
+                seen = True
+                yield line
+        finally:
+            killer.cancel()
+            stream.close()
+            for proc in procs:
+                proc.wait()
+        if timed_out.is_set():
+            # The lines read so far still count, but the result must not pass for complete.
+            errors.append(f"journalctl read for the last {hours}h timed out after {timeout}s; log counts are partial")
+    # Only fall back when the journal itself is empty, not when nothing matched.
+    if not seen and not journal_has_entries(hours) and os.path.exists("/var/log/cron"):
+        try:
+            fallback = tail_lines("/var/log/cron", fallback_lines)
+        except Exception:
+            fallback = []
+        yield from fallback
+
+"""
+
+
+_REMOTE_CRON_LIST_SCRIPT = r"""import glob
 import hashlib
 import json
 import os
 import re
 import subprocess
+import threading
 from datetime import datetime, timezone
 
 ERROR_MARKERS = ("error", "failed", "non-zero", "exit", "traceback")
-TEXT_EXTS = {".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"}
+TEXT_EXTS = frozenset({".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"})
+PARSE_CACHE_PATH = os.path.expanduser("~/.cache/clawfleet/cron_parse_cache.json")
+REDIRECT_RES = [
+    re.compile(r"(?:^|\s)(?:>>|>|2>>|2>|&>)(?:\s*)(/[^\s;|&]+)"),
+    re.compile(r"(?:^|\s)1>>(?:\s*)(/[^\s;|&]+)"),
+    re.compile(r"(?:^|\s)1>(?:\s*)(/[^\s;|&]+)"),
+]
+WS_RE = re.compile(r"\s+")
 
 def build_job_id(source, schedule, command, user):
     payload = f"{source}|{schedule}|{command}|{user or ''}"
@@ -196,13 +342,8 @@ def build_job_id(source, schedule, command, user):
 
 def extract_hints(command):
     candidates = []
-    patterns = [
-        r"(?:^|\s)(?:>>|>|2>>|2>|&>)(?:\s*)(/[^\s;|&]+)",
-        r"(?:^|\s)1>>(?:\s*)(/[^\s;|&]+)",
-        r"(?:^|\s)1>(?:\s*)(/[^\s;|&]+)",
-    ]
-    for pattern in patterns:
-        for m in re.finditer(pattern, command):
+    for pattern in REDIRECT_RES:
+        for m in pattern.finditer(command):
             value = m.group(1).strip().strip("'\"")
             if value.startswith("/") and os.path.splitext(value)[1].lower() in TEXT_EXTS:
                 candidates.append(value)
@@ -221,7 +362,7 @@ def parse_lines(source, lines, has_user):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
-        parts = re.split(r"\s+", line, maxsplit=6 if has_user else 5)
+        parts = WS_RE.split(line, maxsplit=6 if has_user else 5)
         schedule = ""
         user = None
         command = ""
@@ -265,7 +406,7 @@ def parse_lines(source, lines, has_user):
     return out
 
 def keywords(command):
-    tokens = [t for t in re.split(r"\s+", command) if t]
+    tokens = [t for t in WS_RE.split(command) if t]
     if not tokens:
         return []
     values = []
@@ -284,39 +425,61 @@ def keywords(command):
             uniq.append(x)
     return uniq
 
-def read_logs(hours, fallback_lines):
-    lines = []
+""" + _REMOTE_LOG_READER + r"""def load_parse_cache():
+    # key -> parsed rows from the previous run; unchanged crontabs skip parsing.
     try:
-        proc = subprocess.run(
-            ["journalctl", "--since", f"{hours} hours ago", "--no-pager", "-o", "short-iso"],
-            capture_output=True, text=True, timeout=30, check=False
-        )
-        if proc.returncode == 0 and proc.stdout.strip():
-            lines.extend(proc.stdout.splitlines())
-    except Exception:
-        pass
-    if not lines and os.path.exists("/var/log/cron"):
+        with open(PARSE_CACHE_PATH, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+def save_parse_cache(cache):
+    tmp_path = f"{PARSE_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PARSE_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh, separators=(",", ":"))
+        os.replace(tmp_path, PARSE_CACHE_PATH)
+    except OSError:
         try:
-            proc = subprocess.run(["tail", "-n", str(fallback_lines), "/var/log/cron"], capture_output=True, text=True, timeout=10, check=False)
-            if proc.returncode == 0 and proc.stdout.strip():
-                lines.extend(proc.stdout.splitlines())
-        except Exception:
+            os.remove(tmp_path)
+        except OSError:
             pass
-    return lines
+
+def read_file_lines(path):
+    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+        return fh.read().splitlines()
+
+def file_cache_key(source, path):
+    st = os.stat(path)
+    return f"{source}|{path}|{st.st_mtime_ns}|{st.st_size}"
+
+parse_cache = load_parse_cache()
+next_parse_cache = {}
+
+def parse_cached(key, source, read_lines, has_user):
+    rows = parse_cache.get(key)
+    if not isinstance(rows, list):
+        rows = parse_lines(source, read_lines(), has_user)
+    next_parse_cache[key] = rows
+    return rows
 
 jobs = []
 errors = []
 try:
     proc = subprocess.run(["crontab", "-l", "-u", "root"], capture_output=True, text=True, timeout=10, check=False)
     if proc.returncode == 0:
-        jobs.extend(parse_lines("root_crontab", proc.stdout.splitlines(), has_user=False))
+        # crontab -l has no file to stat, so its output is keyed by content.
+        digest = hashlib.sha1(proc.stdout.encode("utf-8")).hexdigest()
+        jobs.extend(parse_cached(f"root_crontab|{digest}", "root_crontab", proc.stdout.splitlines, has_user=False))
 except Exception as exc:
     errors.append(f"root crontab read failed: {exc}")
 
 if os.path.exists("/etc/crontab"):
     try:
-        with open("/etc/crontab", "r", encoding="utf-8", errors="ignore") as fh:
-            jobs.extend(parse_lines("etc_crontab", fh.read().splitlines(), has_user=True))
+        key = file_cache_key("etc_crontab", "/etc/crontab")
+        jobs.extend(parse_cached(key, "etc_crontab", lambda: read_file_lines("/etc/crontab"), has_user=True))
     except Exception as exc:
         errors.append(f"/etc/crontab read failed: {exc}")
 
@@ -324,77 +487,105 @@ for file_path in sorted(glob.glob("/etc/cron.d/*")):
     if not os.path.isfile(file_path):
         continue
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as fh:
-            rows = parse_lines("etc_cron_d", fh.read().splitlines(), has_user=True)
-            jobs.extend(rows)
+        key = file_cache_key("etc_cron_d", file_path)
+        jobs.extend(parse_cached(key, "etc_cron_d", lambda: read_file_lines(file_path), has_user=True))
     except Exception as exc:
         errors.append(f"{file_path} read failed: {exc}")
 
-log_lines_24h = read_logs(24, 2000)
-log_lines_7d = read_logs(24 * 7, 12000)
-for job in jobs:
-    keys = keywords(job["command"])
-    if not keys:
+# Saved before the log scan fills in summaries, so cached rows keep their defaults.
+# Only sources seen in this run are kept, so removed files age out.
+if next_parse_cache != parse_cache:
+    save_parse_cache(next_parse_cache)
+
+def scan_logs(lines, needles, job_count):
+    # One pass over the corpus: every distinct keyword is tested once per line
+    # and the hit is fanned out to all jobs sharing it.
+    runs = [0] * job_count
+    errs = [0] * job_count
+    last_error = [None] * job_count
+    for line in lines:
+        low = line.lower()
+        hit = None
+        for needle, owners in needles:
+            if needle in low:
+                if hit is None:
+                    hit = set(owners)
+                else:
+                    hit.update(owners)
+        if hit is None:
+            continue
+        is_error = False
+        for m in ERROR_MARKERS:
+            if m in low:
+                is_error = True
+                break
+        for index in hit:
+            runs[index] += 1
+            if is_error:
+                errs[index] += 1
+            last_error[index] = is_error
+    return runs, errs, last_error
+
+job_keys = [keywords(job["command"]) for job in jobs]
+keyword_jobs = {}
+for index, keys in enumerate(job_keys):
+    for k in keys:
+        keyword_jobs.setdefault(k, []).append(index)
+needles = list(keyword_jobs.items())
+# Nothing can match without keywords; skip reading the journal entirely.
+needle_words = [k for k, _ in needles]
+log_lines_24h = read_logs(24, 2000, needle_words, 30, errors) if needles else []
+log_lines_7d = read_logs(24 * 7, 12000, needle_words, 30, errors) if needles else []
+runs_24, errs_24, _ = scan_logs(log_lines_24h, needles, len(jobs))
+runs_7d, errs_7d, last_error_7d = scan_logs(log_lines_7d, needles, len(jobs))
+for index, job in enumerate(jobs):
+    if not job_keys[index]:
         continue
-    matched_24 = [line for line in log_lines_24h if any(k in line.lower() for k in keys)]
-    matched_7d = [line for line in log_lines_7d if any(k in line.lower() for k in keys)]
-    err_24 = [line for line in matched_24 if any(m in line.lower() for m in ERROR_MARKERS)]
-    err_7d = [line for line in matched_7d if any(m in line.lower() for m in ERROR_MARKERS)]
-    job["summary"]["runs_24h"] = len(matched_24)
-    job["summary"]["errors_24h"] = len(err_24)
-    job["summary"]["runs_7d"] = len(matched_7d)
-    job["summary"]["errors_7d"] = len(err_7d)
-    if matched_7d:
-        job["summary"]["last_status"] = "error" if matched_7d[-1] in err_7d else "ok"
-    else:
+    job["summary"]["runs_24h"] = runs_24[index]
+    job["summary"]["errors_24h"] = errs_24[index]
+    job["summary"]["runs_7d"] = runs_7d[index]
+    job["summary"]["errors_7d"] = errs_7d[index]
+    if last_error_7d[index] is None:
         job["summary"]["last_status"] = "unknown"
+    else:
+        job["summary"]["last_status"] = "error" if last_error_7d[index] else "ok"
 
 jobs.sort(key=lambda row: (row.get("source", ""), row.get("schedule", ""), row.get("command", "")))
 print(json.dumps({
     "generated_at": datetime.now(timezone.utc).isoformat(),
     "jobs": jobs,
     "errors": errors,
-}))
-PY"""
-    return script
+}))"""
 
 
-def _remote_cron_detail_command(job: dict[str, Any], lines: int) -> str:
-    payload = json.dumps(
-        {
-            "command": str(job.get("command", "")),
-            "schedule": str(job.get("schedule", "")),
-            "job_id": str(job.get("job_id", "")),
-            "output_hints": list(job.get("output_hints", [])),
-            "summary": dict(job.get("summary", {})),
-            "lines": max(20, min(1000, int(lines))),
-        }
-    )
-    return f"""python3 - <<'PY'
-import json
+_REMOTE_CRON_DETAIL_SCRIPT = r"""import json
 import os
 import re
 import subprocess
+import sys
+import threading
 from collections import defaultdict
 from datetime import datetime, timezone
 
 ERROR_MARKERS = ("error", "failed", "non-zero", "exit", "traceback")
-TEXT_EXTS = {{".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"}}
-data = json.loads({json.dumps(payload)})
+TEXT_EXTS = frozenset({".md", ".txt", ".log", ".json", ".yaml", ".yml", ".csv"})
+WS_RE = re.compile(r"\s+")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+data = json.loads(sys.argv[1])
 command = data.get("command", "")
 output_hints = data.get("output_hints", [])
 line_limit = int(data.get("lines", 200))
 
 def keywords(command):
-    tokens = [t for t in re.split(r"\\s+", command) if t]
+    tokens = [t for t in WS_RE.split(command) if t]
     if not tokens:
         return []
     values = []
-    first = os.path.basename(tokens[0].strip("'\\\""))
+    first = os.path.basename(tokens[0].strip("'\""))
     if first:
         values.append(first.lower())
     for t in tokens[1:4]:
-        c = t.strip("'\\\"")
+        c = t.strip("'\"")
         if c.startswith("/"):
             values.append(os.path.basename(c).lower())
     uniq = []
@@ -405,58 +596,57 @@ def keywords(command):
             uniq.append(x)
     return uniq
 
-def read_logs(hours, fallback_lines):
-    lines = []
-    try:
-        proc = subprocess.run(
-            ["journalctl", "--since", f"{{hours}} hours ago", "--no-pager", "-o", "short-iso"],
-            capture_output=True, text=True, timeout=25, check=False
-        )
-        if proc.returncode == 0 and proc.stdout.strip():
-            lines.extend(proc.stdout.splitlines())
-    except Exception:
-        pass
-    if not lines and os.path.exists("/var/log/cron"):
-        try:
-            proc = subprocess.run(["tail", "-n", str(fallback_lines), "/var/log/cron"], capture_output=True, text=True, timeout=10, check=False)
-            if proc.returncode == 0 and proc.stdout.strip():
-                lines.extend(proc.stdout.splitlines())
-        except Exception:
-            pass
-    return lines
-
-def line_date_key(line):
+""" + _REMOTE_LOG_READER + r"""def line_date_key(line):
     head = line[:10]
-    if re.match(r"\\d{{4}}-\\d{{2}}-\\d{{2}}", head):
+    if DATE_RE.match(head):
         return head
     return line[:6].strip()
 
-logs_24h = read_logs(24, 3000)
-logs_7d = read_logs(24 * 7, 12000)
+def scan_matches(lines, keys):
+    # Single pass: keep each matching line with its error flag.
+    matched = []
+    if not keys:
+        return matched
+    for line in lines:
+        low = line.lower()
+        for k in keys:
+            if k in low:
+                break
+        else:
+            continue
+        is_error = False
+        for marker in ERROR_MARKERS:
+            if marker in low:
+                is_error = True
+                break
+        matched.append((line, is_error))
+    return matched
+
 keys = keywords(command)
-matched_24 = [line for line in logs_24h if any(k in line.lower() for k in keys)] if keys else []
-matched_7d = [line for line in logs_7d if any(k in line.lower() for k in keys)] if keys else []
-recent = matched_7d[-line_limit:]
-errors_24 = [line for line in matched_24 if any(marker in line.lower() for marker in ERROR_MARKERS)]
-errors_7d = [line for line in matched_7d if any(marker in line.lower() for marker in ERROR_MARKERS)]
+errors = []
+matched_24 = scan_matches(read_logs(24, 3000, keys, 25, errors), keys)
+matched_7d = scan_matches(read_logs(24 * 7, 12000, keys, 25, errors), keys)
+recent = [line for line, _ in matched_7d[-line_limit:]]
+errors_24 = sum(1 for _, is_error in matched_24 if is_error)
+errors_7d = 0
+buckets = defaultdict(list)
+for line, is_error in matched_7d:
+    errors_7d += is_error
+    buckets[line_date_key(line)].append((line, is_error))
 status = "unknown"
 if matched_7d:
-    status = "error" if matched_7d[-1] in errors_7d else "ok"
+    status = "error" if matched_7d[-1][1] else "ok"
 
-buckets = defaultdict(list)
-for line in matched_7d:
-    buckets[line_date_key(line)].append(line)
 daily_buckets = []
 for date_key in sorted(buckets.keys(), reverse=True):
-    logs = buckets[date_key]
-    errs = [line for line in logs if any(marker in line.lower() for marker in ERROR_MARKERS)]
+    pairs = buckets[date_key]
     daily_buckets.append(
-        {{
+        {
             "date": date_key,
-            "runs": len(logs),
-            "errors": len(errs),
-            "logs": logs[-line_limit:],
-        }}
+            "runs": len(pairs),
+            "errors": sum(1 for _, is_error in pairs if is_error),
+            "logs": [line for line, _ in pairs[-line_limit:]],
+        }
     )
 
 files = []
@@ -465,7 +655,7 @@ for path in output_hints:
     suffix = os.path.splitext(path)[1].lower()
     if suffix not in TEXT_EXTS:
         continue
-    row = {{"remote_path": path, "exists": False, "size_bytes": None, "modified_at": None}}
+    row = {"remote_path": path, "exists": False, "size_bytes": None, "modified_at": None}
     if os.path.exists(path) and os.path.isfile(path):
         st = os.stat(path)
         row["exists"] = True
@@ -473,56 +663,133 @@ for path in output_hints:
         row["modified_at"] = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat()
     files.append(row)
 
-print(json.dumps({{
+print(json.dumps({
     "job_id": data.get("job_id"),
     "schedule": data.get("schedule"),
     "command": command,
     "recent_logs": recent,
-    "summary": {{
+    "summary": {
         "runs_24h": len(matched_24),
-        "errors_24h": len(errors_24),
+        "errors_24h": errors_24,
         "runs_7d": len(matched_7d),
-        "errors_7d": len(errors_7d),
+        "errors_7d": errors_7d,
         "last_status": status,
         "last_run_at": None,
-    }},
+    },
     "daily_buckets": daily_buckets,
     "output_files": files,
-}}))
-PY"""
+    "errors": errors,
+}))"""
+
+
+def _remote_script_path(name: str, script: str) -> str:
+    digest = hashlib.sha256(script.encode("utf-8")).hexdigest()[:16]
+    return f"{REMOTE_SCRIPT_DIR}/{name}_{digest}.py"
+
+
+_CRON_LIST_SCRIPT_PATH = _remote_script_path("cron_list", _REMOTE_CRON_LIST_SCRIPT)
+_CRON_DETAIL_SCRIPT_PATH = _remote_script_path("cron_detail", _REMOTE_CRON_DETAIL_SCRIPT)
+
+
+def _run_remote_script(
+    runner: SSHRunner,
+    host: str,
+    remote_path: str,
+    script: str,
+    args: tuple[str, ...] = (),
+    timeout: int = 120,
+) -> CommandResult:
+    # Scripts are stored on the host under a content-hashed name, so a normal
+    # call only sends the short invocation; the source is shipped once per
+    # host and again only when the script changes.
+    invoke = " ".join(["python3", remote_path, *(shlex.quote(arg) for arg in args)])
+    result = runner.run_ssh(
+        host,
+        f"test -f {remote_path} || exit {_REMOTE_SCRIPT_MISSING_RC}; {invoke}",
+        timeout=timeout,
+    )
+    if result.returncode != _REMOTE_SCRIPT_MISSING_RC:
+        return result
+    staging = f"{remote_path}.$$"
+    upload = (
+        f"mkdir -p {REMOTE_SCRIPT_DIR} && cat > {staging} <<'PY' && mv {staging} {remote_path} && {invoke}\n"
+        f"{script}\nPY"
+    )
+    return runner.run_ssh(host, upload, timeout=timeout)
+
+
+def _cron_detail_payload(job: dict[str, Any], lines: int) -> str:
+    return json.dumps(
+        {
+            "command": str(job.get("command", "")),
+            "schedule": str(job.get("schedule", "")),
+            "job_id": str(job.get("job_id", "")),
+            "output_hints": list(job.get("output_hints", [])),
+            "summary": dict(job.get("summary", {})),
+            "lines": max(20, min(1000, int(lines))),
+        }
+    )
+
+
+def invalidate_cron_cache() -> None:
+    with _cron_cache_lock:
+        _cron_cache.clear()
+
+
+def _collect_server_cron_jobs(server: ServerConfig, runner: SSHRunner) -> dict[str, Any]:
+    result = _run_remote_script(runner, server.ssh_host, _CRON_LIST_SCRIPT_PATH, _REMOTE_CRON_LIST_SCRIPT)
+    if result.returncode != 0:
+        return {
+            "server_name": server.name,
+            "jobs": [],
+            "error": result.stderr.strip() or "cron collect failed",
+        }
+    try:
+        parsed = json.loads(result.stdout or "{}")
+        jobs = parsed.get("jobs", [])
+        errors = parsed.get("errors", [])
+        if not isinstance(jobs, list):
+            jobs = []
+        if not isinstance(errors, list):
+            errors = []
+    except Exception as exc:
+        return {
+            "server_name": server.name,
+            "jobs": [],
+            "error": f"parse cron payload failed: {exc}",
+        }
+    server_payload = {
+        "server_name": server.name,
+        "jobs": jobs,
+        "error": " | ".join(str(item) for item in errors) if errors else None,
+    }
+    jobs_by_id = {str(item.get("job_id")): item for item in jobs if isinstance(item, dict)}
+    with _cron_cache_lock:
+        _cron_cache[(server.name, server.ssh_host)] = (
+            time.monotonic() + CRON_CACHE_TTL_SECONDS,
+            server_payload,
+            jobs_by_id,
+        )
+    return server_payload
+
+
+def _cached_server_jobs(server: ServerConfig) -> dict[str, dict[str, Any]] | None:
+    with _cron_cache_lock:
+        cached = _cron_cache.get((server.name, server.ssh_host))
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[2]
 
 
 def collect_cron_jobs(config: AppConfig, runner: SSHRunner) -> dict[str, Any]:
     payload: dict[str, Any] = {"generated_at": datetime.now(timezone.utc).isoformat(), "servers": {}}
-    command = _remote_cron_list_command()
-    for server in config.servers:
-        result = runner.run_ssh(server.ssh_host, command, timeout=120)
-        if result.returncode != 0:
-            payload["servers"][server.name] = {
-                "server_name": server.name,
-                "jobs": [],
-                "error": result.stderr.strip() or "cron collect failed",
-            }
-            continue
-        try:
-            parsed = json.loads(result.stdout or "{}")
-            jobs = parsed.get("jobs", [])
-            errors = parsed.get("errors", [])
-            if not isinstance(jobs, list):
-                jobs = []
-            if not isinstance(errors, list):
-                errors = []
-            payload["servers"][server.name] = {
-                "server_name": server.name,
-                "jobs": jobs,
-                "error": " | ".join(str(item) for item in errors) if errors else None,
-            }
-        except Exception as exc:
-            payload["servers"][server.name] = {
-                "server_name": server.name,
-                "jobs": [],
-                "error": f"parse cron payload failed: {exc}",
-            }
+    servers = list(config.servers)
+    if not servers:
+        return payload
+    with ThreadPoolExecutor(max_workers=min(16, len(servers))) as pool:
+        results = pool.map(lambda server: _collect_server_cron_jobs(server, runner), servers)
+        for server, server_payload in zip(servers, results):
+            payload["servers"][server.name] = server_payload
     return payload
 
 
@@ -534,17 +801,25 @@ def get_cron_job_detail(
     lines: int = 200,
 ) -> dict[str, Any]:
     selected = _resolve_server(config, server)
-    listing = collect_cron_jobs(config, runner)
-    server_payload = listing.get("servers", {}).get(selected.name, {})
-    jobs = server_payload.get("jobs", [])
-    job = next((item for item in jobs if str(item.get("job_id")) == job_id), None)
+    jobs_by_id = _cached_server_jobs(selected)
+    job = jobs_by_id.get(job_id) if jobs_by_id is not None else None
+    if job is None:
+        # Cache miss or a job added since the last listing: re-collect this server only.
+        _collect_server_cron_jobs(selected, runner)
+        job = (_cached_server_jobs(selected) or {}).get(job_id)
     if job is None:
         raise ValueError(f"Unknown job_id: {job_id}")
-    detail_command = _remote_cron_detail_command(job, lines)
-    result = runner.run_ssh(selected.ssh_host, detail_command, timeout=120)
+    result = _run_remote_script(
+        runner,
+        selected.ssh_host,
+        _CRON_DETAIL_SCRIPT_PATH,
+        _REMOTE_CRON_DETAIL_SCRIPT,
+        args=(_cron_detail_payload(job, lines),),
+    )
     if result.returncode != 0:
         raise RuntimeError(result.stderr.strip() or "cron detail failed")
     detail = json.loads(result.stdout or "{}")
+    errors = detail.get("errors") or []
     return {
         "server_name": selected.name,
         "job_id": job_id,
@@ -554,7 +829,7 @@ def get_cron_job_detail(
         "summary": detail.get("summary", job.get("summary", {})),
         "daily_buckets": detail.get("daily_buckets", []),
         "output_files": detail.get("output_files", []),
-        "error": None,
+        "error": " | ".join(str(item) for item in errors) if errors else None,
     }
 
 
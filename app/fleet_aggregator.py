@@ -1,23 +1,23 @@
 from __future__ import annotations
 
+import re
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Any
 
 from app.config import AppConfig, ServerConfig
 from app.ssh_runner import SSHRunner
 
+# A whitespace-separated "N%" field, as in df output.
+_PERCENT_RE = re.compile(r"(?<!\S)(\d+)%(?!\S)")
+
 
 def parse_disk_usage_percent(raw: str) -> int | None:
     if not raw:
         return None
-    tokens = raw.split()
-    for token in tokens:
-        if token.endswith("%"):
-            number = token.rstrip("%")
-            if number.isdigit():
-                return int(number)
-    return None
+    match = _PERCENT_RE.search(raw)
+    return int(match.group(1)) if match else None
 
 
 def parse_runtime_summary(runtime_entry: dict[str, Any] | None) -> tuple[int, int, float]:
@@ -69,26 +69,34 @@ def build_fleet_overview(
     servers = [server for server in config.servers if server.enabled]
     status_servers = status_cache.get("servers", {}) if isinstance(status_cache, dict) else {}
     runtime_servers = runtime_cache.get("servers", {}) if isinstance(runtime_cache, dict) else {}
+    if not isinstance(status_servers, dict):
+        status_servers = {}
+    if not isinstance(runtime_servers, dict):
+        runtime_servers = {}
     generated_at = datetime.now(timezone.utc).isoformat()
+    status_get = status_servers.get
+    runtime_get = runtime_servers.get
 
     nodes: list[dict[str, Any]] = []
-    by_type: dict[str, int] = {}
-    by_label: dict[str, int] = {}
     reachable_count = 0
     gateway_active_count = 0
     abnormal_count = 0
 
     for server in servers:
-        entry = status_servers.get(server.name, {}) if isinstance(status_servers, dict) else {}
+        name = server.name
+        entry = status_get(name, {})
         details = entry.get("details", {}) if isinstance(entry, dict) else {}
-        runtime = runtime_servers.get(server.name, {}) if isinstance(runtime_servers, dict) else {}
-        sessions_24h, errors_24h, error_rate_24h = parse_runtime_summary(runtime)
+        details_get = details.get
+        sessions_24h, errors_24h, error_rate_24h = parse_runtime_summary(runtime_get(name, {}))
         disk_risks = _disk_risks(details)
+        gateway_status = details_get("gateway_status", "unknown")
+        gateway_active = gateway_status == "active"
+        captured_at = entry.get("captured_at")
         reasons: list[str] = []
         reachable = bool(entry.get("reachable"))
         if not reachable:
             reasons.append("unreachable")
-        if details.get("gateway_status") != "active":
+        if not gateway_active:
             reasons.append("gateway_inactive")
         if disk_risks:
             reasons.append("disk_high_usage")
@@ -98,27 +106,23 @@ def build_fleet_overview(
             abnormal_count += 1
         if reachable:
             reachable_count += 1
-        if details.get("gateway_status") == "active":
+        if gateway_active:
             gateway_active_count += 1
 
-        by_type[server.type] = by_type.get(server.type, 0) + 1
-        for label in server.labels:
-            by_label[label] = by_label.get(label, 0) + 1
-
         nodes.append(
             {
-                "name": server.name,
+                "name": name,
                 "ssh_host": server.ssh_host,
                 "type": server.type,
                 "labels": list(server.labels),
                 "enabled": server.enabled,
                 "reachable": reachable,
-                "captured_at": entry.get("captured_at"),
-                "last_heartbeat": entry.get("captured_at"),
-                "gateway_status": details.get("gateway_status", "unknown"),
-                "gateway_port_listen": details.get("gateway_port_listen", "unknown"),
-                "ssh_latency_ms": details.get("ssh_latency_ms"),
-                "clock_offset_sec": details.get("clock_offset_sec"),
+                "captured_at": captured_at,
+                "last_heartbeat": captured_at,
+                "gateway_status": gateway_status,
+                "gateway_port_listen": details_get("gateway_port_listen", "unknown"),
+                "ssh_latency_ms": details_get("ssh_latency_ms"),
+                "clock_offset_sec": details_get("clock_offset_sec"),
                 "disk_risks": disk_risks,
                 "agent_sessions_24h": sessions_24h,
                 "agent_errors_24h": errors_24h,
@@ -143,8 +147,8 @@ def build_fleet_overview(
             "abnormal_nodes": abnormal_count,
         },
         "groups": {
-            "by_type": by_type,
-            "by_label": by_label,
+            "by_type": dict(Counter(server.type for server in servers)),
+            "by_label": dict(Counter(label for server in servers for label in server.labels)),
         },
         "nodes": sorted(nodes, key=lambda item: item["name"]),
     }
@@ -157,9 +161,36 @@ def _find_server(config: AppConfig, server_name: str) -> ServerConfig:
     return matched[0]
 
 
-def _check_command(runner: SSHRunner, host: str, command: str, timeout: int = 10) -> bool:
-    result = runner.run_ssh(host, command, timeout=timeout)
-    return result.returncode == 0 and result.stdout.strip() == "ok"
+# (check name, shell test, detail on failure, hint); all run in one SSH call.
+_NODE_PROBES: tuple[tuple[str, str, str, str], ...] = (
+    ("command_openclaw", "command -v openclaw", "missing command", "安装缺失工具后可提升管理能力"),
+    ("command_rsync", "command -v rsync", "missing command", "安装缺失工具后可提升管理能力"),
+    ("command_systemctl", "command -v systemctl", "missing command", "安装缺失工具后可提升管理能力"),
+    ("command_journalctl", "command -v journalctl", "missing command", "安装缺失工具后可提升管理能力"),
+    ("command_ss", "command -v ss", "missing command", "安装缺失工具后可提升管理能力"),
+    ("path_files_dir", "test -d /root/files", "missing directory", "请确认 OpenClaw 目录结构是否完整"),
+    ("path_workspace_dir", "test -d /root/.openclaw/workspace", "missing directory", "请确认 OpenClaw 目录结构是否完整"),
+    ("path_agents_dir", "test -d /root/.openclaw/agents", "missing directory", "请确认 OpenClaw 目录结构是否完整"),
+    (
+        "permission_temp_write",
+        "bash -lc 'touch /tmp/.clawfleet_probe && rm -f /tmp/.clawfleet_probe'",
+        "write failed",
+        "检查用户权限和 /tmp 写入权限",
+    ),
+)
+_NODE_PROBE_SCRIPT = "; ".join(
+    f"if {test} >/dev/null 2>&1; then echo {name}=ok; else echo {name}=fail; fi" for name, test, _, _ in _NODE_PROBES
+)
+
+
+def _run_node_probes(runner: SSHRunner, host: str, timeout: int = 30) -> dict[str, bool]:
+    result = runner.run_ssh(host, _NODE_PROBE_SCRIPT, timeout=timeout)
+    outcomes: dict[str, bool] = {}
+    for line in result.stdout.splitlines():
+        name, sep, value = line.strip().partition("=")
+        if sep:
+            outcomes[name] = value == "ok"
+    return outcomes
 
 
 def run_node_check(config: AppConfig, runner: SSHRunner, server_name: str) -> dict[str, Any]:
@@ -189,54 +220,18 @@ def run_node_check(config: AppConfig, runner: SSHRunner, server_name: str) -> di
             "suggestions": ["SSH 不可达，请先修复连接后重试。"],
         }
 
-    command_checks = [
-        ("command_openclaw", "command -v openclaw >/dev/null 2>&1 && echo ok"),
-        ("command_rsync", "command -v rsync >/dev/null 2>&1 && echo ok"),
-        ("command_systemctl", "command -v systemctl >/dev/null 2>&1 && echo ok"),
-        ("command_journalctl", "command -v journalctl >/dev/null 2>&1 && echo ok"),
-        ("command_ss", "command -v ss >/dev/null 2>&1 && echo ok"),
-    ]
-    for check_name, command in command_checks:
-        ok = _check_command(runner, server.ssh_host, command)
+    outcomes = _run_node_probes(runner, server.ssh_host)
+    for check_name, _, failure_detail, hint in _NODE_PROBES:
+        ok = outcomes.get(check_name, False)
         checks.append(
             {
                 "name": check_name,
                 "ok": ok,
-                "detail": "ok" if ok else "missing command",
-                "hint": "安装缺失工具后可提升管理能力",
+                "detail": "ok" if ok else failure_detail,
+                "hint": hint,
             }
         )
 
-    path_checks = [
-        ("path_files_dir", "test -d /root/files && echo ok"),
-        ("path_workspace_dir", "test -d /root/.openclaw/workspace && echo ok"),
-        ("path_agents_dir", "test -d /root/.openclaw/agents && echo ok"),
-    ]
-    for check_name, command in path_checks:
-        ok = _check_command(runner, server.ssh_host, command)
-        checks.append(
-            {
-                "name": check_name,
-                "ok": ok,
-                "detail": "ok" if ok else "missing directory",
-                "hint": "请确认 OpenClaw 目录结构是否完整",
-            }
-        )
-
-    perm_ok = _check_command(
-        runner,
-        server.ssh_host,
-        "bash -lc 'touch /tmp/.clawfleet_probe && rm -f /tmp/.clawfleet_probe && echo ok'",
-    )
-    checks.append(
-        {
-            "name": "permission_temp_write",
-            "ok": perm_ok,
-            "detail": "ok" if perm_ok else "write failed",
-            "hint": "检查用户权限和 /tmp 写入权限",
-        }
-    )
-
     ok_count = len([item for item in checks if item["ok"]])
     score = int((ok_count / len(checks)) * 100) if checks else 0
     suggestions = [item["hint"] for item in checks if not item["ok"]][:5]
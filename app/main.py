@@ -1,22 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import binascii
+import gzip
+import hashlib
 import json
+import os
 import platform
-import secrets
+import queue
+import random
+import re
+import socket
+import stat
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from http.cookies import SimpleCookie
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl
 
 from app.config import AppConfig, ConfigError, ServerConfig, load_config
 from app.agent_runtime_collector import collect_agent_runtime_all
 from app.alert_engine import evaluate_alerts, validate_alert_rules
-from app.cron_manager import collect_cron_jobs, get_cron_job_detail, open_cron_output_file
+from app.cron_manager import (
+    collect_cron_jobs,
+    get_cron_job_detail,
+    invalidate_cron_cache,
+    open_cron_output_file,
+)
 from app.fleet_aggregator import build_fleet_overview, run_node_check
 from app.maintenance_actions import run_backup, run_update
 from app.security_manager import SecurityManager, SessionInfo
@@ -35,33 +50,151 @@ from app.sync_executor import execute_plan
 from app.terminal_launcher_macos import open_terminal_for_host
 from app.versioning import get_app_version
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 WEB_ROOT = PROJECT_ROOT / "web"
+WEB_ROOT_RESOLVED = WEB_ROOT.resolve()
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+MAX_JSON_BODY_BYTES = 1024 * 1024
+# web/ is treated as immutable once loaded; CLAWFLEET_STATIC_RELOAD=1 re-checks
+# mtime/size on every request so front-end edits show up without a restart.
+STATIC_RELOAD = os.environ.get("CLAWFLEET_STATIC_RELOAD") == "1"
+STATIC_REVALIDATE_SECONDS = 0.0 if STATIC_RELOAD else float("inf")
+MAX_SYNC_PLANS = 256
+MAX_BATCH_REQUESTS = 32
+# Socket timeout while a request is being read, and the (much shorter) time an idle
+# kept-alive connection may hold its pool worker waiting for the next request.
+KEEPALIVE_TIMEOUT_SECONDS = 15
+KEEPALIVE_IDLE_SECONDS = 2.0
+STATIC_CACHE_MAX_BYTES = 1024 * 1024
+STATIC_GZIP_MIN_BYTES = 512
+_STATIC_CONTENT_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+}
+LOGOUT_COOKIE = "clawfleet_session=; Path=/; HttpOnly; SameSite=Strict; Max-Age=0"
 APP_VERSION = get_app_version()
+_SESSION_COOKIE_RE = re.compile(r"(?:^|;)\s*clawfleet_session=([^;]*)")
+POLL_MIN_INTERVAL_SECONDS = 1.0
+POLL_MAX_BACKOFF_SECONDS = 60.0
+POLL_JITTER_RATIO = 0.1
+# With no UI polling for this long the refresh loop stretches its interval.
+POLL_IDLE_AFTER_SECONDS = 60.0
+POLL_IDLE_MAX_SECONDS = 300.0
+# Runs the agent runtime collection alongside status collection in the refresh loop.
+_refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+# Only one system auth dialog can be answered at a time, so prompts run one by one here.
+_biometric_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="biometric")
+
+
+def _dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes | memoryview) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
+VERSION_BYTES = _dumps({"version": APP_VERSION})
+
+
+def _etag_for(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _encode_snapshot(payload: dict) -> tuple[bytes, str]:
+    body = _dumps(payload)
+    return body, _etag_for(body)
+
+
+def _public_config_bytes(config: AppConfig) -> bytes:
+    payload = config.to_dict()
+    if payload.get("sync", {}).get("ssh_key_path"):
+        payload["sync"]["ssh_key_path"] = "***"
+    if payload.get("security"):
+        payload["security"]["password"] = "***"
+        payload["security"]["operation_confirm_code"] = "***"
+    return _dumps(payload)
+
+
+def _session_cookie_template(config: AppConfig) -> str:
+    return (
+        "clawfleet_session={sid}; Path=/; HttpOnly; SameSite=Strict; "
+        f"Max-Age={config.security.session_ttl_seconds}"
+    )
+
+
+def _build_server_index(servers: list[ServerConfig]) -> dict[str, ServerConfig]:
+    index: dict[str, ServerConfig] = {}
+    for item in servers:
+        index[item.name] = item
+        index[item.ssh_host] = item
+    return index
 
 
 class AppState:
     def __init__(self) -> None:
         self.config = load_config(PROJECT_ROOT)
+        self.config_public_bytes = _public_config_bytes(self.config)
+        self.cookie_template = _session_cookie_template(self.config)
+        self.server_index = _build_server_index(self.config.servers)
+        self.enabled_server_names = [server.name for server in self.config.servers if server.enabled]
         self.runner = SSHRunner(self.config.sync.ssh_key_path)
         self.security = SecurityManager(self.config.security)
-        self.status_lock = threading.Lock()
-        self.status_cache: dict = {"servers": {}, "updated_at": None}
-        self.runtime_lock = threading.Lock()
-        self.agent_runtime_cache: dict = {"servers": {}, "updated_at": None, "window_hours": 24}
-        self.fleet_lock = threading.Lock()
-        self.fleet_cache: dict = {"generated_at": None, "summary": {}, "groups": {}, "nodes": []}
-        self.alerts_lock = threading.Lock()
-        self.alerts_cache: dict = {"generated_at": None, "summary": {}, "events": [], "rules": []}
-        self.plans_lock = threading.Lock()
-        self.plans: dict[str, dict] = {}
+        # Snapshot caches are published by swapping the whole dict; readers take the
+        # current reference without locking, so a published dict is never mutated.
+        # Each one is serialized once on publish, with an ETag for conditional GETs.
+        self.snapshot_bodies: dict[str, tuple[bytes, str]] = {}
+        self.status_cache: dict = {}
+        self.agent_runtime_cache: dict = {}
+        self.fleet_cache: dict = {}
+        self.alerts_cache: dict = {}
+        self.publish("status_cache", {"servers": {}, "updated_at": None})
+        self.publish("agent_runtime_cache", {"servers": {}, "updated_at": None, "window_hours": 24})
+        self.publish("fleet_cache", {"generated_at": None, "summary": {}, "groups": {}, "nodes": []})
+        self.publish("alerts_cache", {"generated_at": None, "summary": {}, "events": [], "rules": []})
+        # Sync plans by id, oldest first. Single get/set/popitem calls are atomic
+        # under the GIL, so the store is used without a lock.
+        self.plans: OrderedDict[str, dict] = OrderedDict()
         self.stop_event = threading.Event()
+        # Last snapshot poll from a client; the refresh loop slows down while nobody
+        # is watching and wake_event cuts an idle sleep short when someone returns.
+        self.last_client_poll = time.monotonic()
+        self.wake_event = threading.Event()
+
+    def note_client_poll(self) -> None:
+        now = time.monotonic()
+        idle = now - self.last_client_poll
+        self.last_client_poll = now
+        if idle >= POLL_IDLE_AFTER_SECONDS:
+            self.wake_event.set()
+
+    def publish(self, name: str, payload: dict) -> None:
+        setattr(self, name, payload)
+        self.snapshot_bodies[name] = _encode_snapshot(payload)
 
     def reload_config(self) -> None:
         cfg = load_config(PROJECT_ROOT)
         self.config = cfg
+        self.config_public_bytes = _public_config_bytes(cfg)
+        self.cookie_template = _session_cookie_template(cfg)
+        self.server_index = _build_server_index(cfg.servers)
+        self.enabled_server_names = [server.name for server in cfg.servers if server.enabled]
+        if cfg.sync.ssh_key_path != self.runner.ssh_key_path:
+            # Masters authenticated with the old key would otherwise keep being reused.
+            self.runner.close_masters([server.ssh_host for server in cfg.servers])
         self.runner = SSHRunner(cfg.sync.ssh_key_path)
         self.security.refresh_config(cfg.security)
+        invalidate_cron_cache()
 
 
 state = AppState()
@@ -82,14 +215,12 @@ def _resolve_sync_servers(
     mode: str,
     source_server_input: object,
     target_server_input: object,
+    server_index: dict[str, ServerConfig] | None = None,
 ) -> tuple[ServerConfig, ServerConfig]:
     if len(config.servers) < 2:
         raise ValueError("At least two servers are required")
 
-    by_key: dict[str, ServerConfig] = {}
-    for item in config.servers:
-        by_key[item.name] = item
-        by_key[item.ssh_host] = item
+    by_key = server_index if server_index is not None else _build_server_index(config.servers)
 
     source_server: ServerConfig
     target_server: ServerConfig
@@ -116,51 +247,75 @@ def _resolve_sync_servers(
     return source_server, target_server
 
 
+def _next_poll_delay(base_interval: float, elapsed: float, failures: int) -> float:
+    if failures:
+        delay = min(POLL_MAX_BACKOFF_SECONDS, base_interval * 2 ** min(failures, 8))
+    else:
+        delay = base_interval - elapsed
+    spread = abs(delay) * POLL_JITTER_RATIO
+    return max(POLL_MIN_INTERVAL_SECONDS, delay + random.uniform(-spread, spread))
+
+
+def _idle_poll_interval(base_interval: float, idle: float) -> float:
+    if idle < POLL_IDLE_AFTER_SECONDS:
+        return base_interval
+    stretched = base_interval * (1 + idle / POLL_IDLE_AFTER_SECONDS)
+    return max(base_interval, min(POLL_IDLE_MAX_SECONDS, stretched))
+
+
 def _refresh_status_loop() -> None:
     runtime_interval_seconds = 30
     last_runtime_refresh = 0.0
+    failures = 0
     while not state.stop_event.is_set():
-        now_iso = datetime.now(timezone.utc).isoformat()
+        started = time.monotonic()
+        failed = False
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        now_ts = now.timestamp()
+        runtime_future = None
+        if now_ts - last_runtime_refresh >= runtime_interval_seconds:
+            runtime_future = _refresh_pool.submit(
+                collect_agent_runtime_all, state.config, state.runner, window_hours=24
+            )
+            last_runtime_refresh = now_ts
+
         try:
             latest = collect_all_status(state.config, state.runner)
-            with state.status_lock:
-                state.status_cache = {
-                    "servers": latest,
-                    "updated_at": now_iso,
-                }
+            state.publish("status_cache", {
+                "servers": latest,
+                "updated_at": now_iso,
+            })
         except Exception as exc:
-            with state.status_lock:
-                state.status_cache = {
-                    "servers": {},
-                    "updated_at": now_iso,
-                    "error": f"status refresh failed: {exc}",
-                }
-
-        now_ts = time.time()
-        if now_ts - last_runtime_refresh >= runtime_interval_seconds:
+            failed = True
+            state.publish("status_cache", {
+                "servers": {},
+                "updated_at": now_iso,
+                "error": f"status refresh failed: {exc}",
+            })
+
+        if runtime_future is not None:
             try:
-                runtime = collect_agent_runtime_all(state.config, state.runner, window_hours=24)
-                with state.runtime_lock:
-                    state.agent_runtime_cache = {
-                        "servers": runtime,
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                        "window_hours": 24,
-                    }
+                runtime = runtime_future.result()
+                state.publish("agent_runtime_cache", {
+                    "servers": runtime,
+                    "updated_at": now_iso,
+                    "window_hours": 24,
+                })
             except Exception as exc:
-                with state.runtime_lock:
-                    state.agent_runtime_cache = {
-                        "servers": {},
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                        "window_hours": 24,
-                        "error": f"agent runtime refresh failed: {exc}",
-                    }
-            last_runtime_refresh = now_ts
+                failed = True
+                state.publish("agent_runtime_cache", {
+                    "servers": {},
+                    "updated_at": now_iso,
+                    "window_hours": 24,
+                    "error": f"agent runtime refresh failed: {exc}",
+                })
 
         try:
-            with state.status_lock:
-                status_snapshot = dict(state.status_cache)
-            with state.runtime_lock:
-                runtime_snapshot = dict(state.agent_runtime_cache)
+            # Published caches are never mutated, so the current references are a
+            # consistent snapshot; the aggregators below must only read them.
+            status_snapshot = state.status_cache
+            runtime_snapshot = state.agent_runtime_cache
             fleet = build_fleet_overview(
                 config=state.config,
                 status_cache=status_snapshot,
@@ -171,28 +326,29 @@ def _refresh_status_loop() -> None:
                 status_cache=status_snapshot,
                 runtime_cache=runtime_snapshot,
             )
-            with state.fleet_lock:
-                state.fleet_cache = fleet
-            with state.alerts_lock:
-                state.alerts_cache = alerts
+            state.publish("fleet_cache", fleet)
+            state.publish("alerts_cache", alerts)
         except Exception as exc:
-            with state.fleet_lock:
-                state.fleet_cache = {
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "summary": {},
-                    "groups": {},
-                    "nodes": [],
-                    "error": f"fleet aggregation failed: {exc}",
-                }
-            with state.alerts_lock:
-                state.alerts_cache = {
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "summary": {"total": 0, "critical": 0, "warning": 0, "info": 0, "by_server": {}},
-                    "events": [],
-                    "rules": [],
-                    "error": f"alert evaluation failed: {exc}",
-                }
-        state.stop_event.wait(state.config.poll_interval_seconds)
+            failed = True
+            state.publish("fleet_cache", {
+                "generated_at": now_iso,
+                "summary": {},
+                "groups": {},
+                "nodes": [],
+                "error": f"fleet aggregation failed: {exc}",
+            })
+            state.publish("alerts_cache", {
+                "generated_at": now_iso,
+                "summary": {"total": 0, "critical": 0, "warning": 0, "info": 0, "by_server": {}},
+                "events": [],
+                "rules": [],
+                "error": f"alert evaluation failed: {exc}",
+            })
+        failures = failures + 1 if failed else 0
+        idle = time.monotonic() - state.last_client_poll
+        interval = _idle_poll_interval(state.config.poll_interval_seconds, idle)
+        state.wake_event.wait(_next_poll_delay(interval, time.monotonic() - started, failures))
+        state.wake_event.clear()
 
 
 def _json_response(
@@ -201,9 +357,58 @@ def _json_response(
     payload: dict,
     extra_headers: dict[str, str] | None = None,
 ) -> None:
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    body = _dumps(payload)
+    _json_body_response(handler, status, body, extra_headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+def _snapshot_response(
+    handler: BaseHTTPRequestHandler,
+    snapshot: tuple[bytes, str],
+    content_type: str = JSON_CONTENT_TYPE,
+    extra_headers: dict[str, str] | None = None,
+) -> None:
+    body, etag = snapshot
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if extra_headers:
+        headers.update(extra_headers)
+    if _etag_matches(handler.headers.get("If-None-Match", ""), etag):
+        handler.send_response(HTTPStatus.NOT_MODIFIED)
+        if handler.close_connection:
+            handler.send_header("Connection", "close")
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        return
+    _body_response(handler, HTTPStatus.OK, body, content_type, headers)
+
+
+def _json_body_response(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    body: bytes,
+    extra_headers: dict[str, str] | None = None,
+) -> None:
+    _body_response(handler, status, body, JSON_CONTENT_TYPE, extra_headers)
+
+
+def _body_response(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    body: bytes,
+    content_type: str,
+    extra_headers: dict[str, str] | None = None,
+) -> None:
     handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
+    handler.send_header("Content-Type", content_type)
+    if handler.close_connection:
+        handler.send_header("Connection", "close")
     if extra_headers:
         for key, value in extra_headers.items():
             handler.send_header(key, value)
@@ -212,26 +417,214 @@ def _json_response(
     handler.wfile.write(body)
 
 
+# Per-worker scratch buffer for request bodies, grown in powers of two.
+_body_buffers = threading.local()
+
+
+def _body_buffer(length: int) -> bytearray:
+    buf = getattr(_body_buffers, "buf", None)
+    if buf is None or len(buf) < length:
+        buf = _body_buffers.buf = bytearray(max(8192, 1 << (length - 1).bit_length()))
+    return buf
+
+
 def _read_json(handler: BaseHTTPRequestHandler) -> dict:
-    length = int(handler.headers.get("Content-Length", "0"))
+    try:
+        length = int(handler.headers.get("Content-Length", "0"))
+    except ValueError:
+        # The body cannot be skipped, so the connection cannot be reused.
+        handler.close_connection = True
+        raise ValueError("Invalid Content-Length header") from None
     if length <= 0:
         return {}
-    raw = handler.rfile.read(length)
-    if not raw:
-        return {}
-    try:
-        value = json.loads(raw.decode("utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Invalid JSON body: {exc}") from exc
+    if length > MAX_JSON_BODY_BYTES:
+        handler.close_connection = True
+        raise ValueError(f"JSON body too large (limit {MAX_JSON_BODY_BYTES} bytes)")
+    with memoryview(_body_buffer(length)) as view:
+        received = handler.rfile.readinto(view[:length]) or 0
+        if not received:
+            return {}
+        try:
+            value = _loads(view[:received])
+        except ValueError as exc:
+            raise ValueError(f"Invalid JSON body: {exc}") from exc
     if not isinstance(value, dict):
         raise ValueError("JSON body must be an object")
     return value
 
 
+def _index_web_files() -> dict[str, Path]:
+    files: dict[str, Path] = {}
+    if not WEB_ROOT_RESOLVED.is_dir():
+        return files
+    for item in WEB_ROOT_RESOLVED.rglob("*"):
+        if not item.is_file():
+            continue
+        resolved = item.resolve()
+        if resolved.is_relative_to(WEB_ROOT_RESOLVED):
+            files[item.relative_to(WEB_ROOT_RESOLVED).as_posix()] = resolved
+    return files
+
+
+# Files shipped under web/ at startup; anything else falls back to a resolve() check.
+_WEB_FILES = _index_web_files()
+
+
+# POST body fields as (name, required) pairs; all of them are strings. Required
+# fields must be non-empty, optional ones may be missing/null.
+_NODE_CHECK_FIELDS = (("server_name", True),)
+_MAINTENANCE_FIELDS = (("server", False),)
+_SKILL_INSTALL_FIELDS = (
+    ("server", False),
+    ("repo_url", False),
+    ("prompt", False),
+    ("market_path", False),
+    ("market_name", False),
+)
+_MARKET_DETAIL_FIELDS = (("market_path", False), ("market_name", False))
+_SKILL_COPY_FIELDS = (("source_server", True), ("target_server", True))
+_CRON_DETAIL_FIELDS = (("server", True), ("job_id", True))
+_CRON_OUTPUT_FIELDS = (("server", True), ("remote_path", True))
+
+
+def _validate_body(body: dict, schema: tuple[tuple[str, bool], ...]) -> tuple[dict, str | None]:
+    fields: dict = {}
+    for name, required in schema:
+        value = body.get(name)
+        if required:
+            if not isinstance(value, str) or not value:
+                return fields, f"{name} must be non-empty string"
+        elif value is not None and not isinstance(value, str):
+            return fields, f"{name} must be string"
+        fields[name] = value
+    return fields, None
+
+
+# Static file bodies by resolved path, reused while (mtime_ns, size) is unchanged.
+# Entries are (checked_at, (mtime_ns, size), asset); a hit within
+# STATIC_REVALIDATE_SECONDS of the last check is served without touching the disk.
+# An asset is (body, etag, gzip_variant) where the gzip variant is (gz_body, gz_etag)
+# or None when compression would not pay off.
+_StaticAsset = tuple[bytes, str, tuple[bytes, str] | None]
+_static_cache: dict[Path, tuple[float, tuple[int, int], _StaticAsset]] = {}
+
+
+def _gzip_variant(body: bytes) -> tuple[bytes, str] | None:
+    if len(body) < STATIC_GZIP_MIN_BYTES:
+        return None
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(compressed) >= len(body):
+        return None
+    return compressed, _etag_for(compressed)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        name, _, value = params.partition("=")
+        if name.strip().lower() != "q":
+            return True
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _load_static(path: Path) -> _StaticAsset | None:
+    now = time.monotonic()
+    cached = _static_cache.get(path)
+    if cached is not None and now - cached[0] < STATIC_REVALIDATE_SECONDS:
+        return cached[2]
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(info.st_mode) or info.st_size > STATIC_CACHE_MAX_BYTES:
+        return None
+    key = (info.st_mtime_ns, info.st_size)
+    if cached is not None and cached[1] == key:
+        _static_cache[path] = (now, key, cached[2])
+        return cached[2]
+    try:
+        body = path.read_bytes()
+    except OSError:
+        return None
+    entry = (body, _etag_for(body), _gzip_variant(body))
+    _static_cache[path] = (now, key, entry)
+    return entry
+
+
+@lru_cache(maxsize=256)
+def _static_headers(content_type: str, length: int, etag: str, encoding: str, vary: bool) -> tuple[tuple[str, str], ...]:
+    headers = [
+        ("Content-Type", content_type),
+        ("Content-Length", str(length)),
+        ("ETag", etag),
+        ("Cache-Control", "no-cache"),
+    ]
+    if vary:
+        headers.append(("Vary", "Accept-Encoding"))
+    if encoding:
+        headers.append(("Content-Encoding", encoding))
+    return tuple(headers)
+
+
+# Read-only endpoints that /api/batch can answer, mapped to their snapshot names.
+_BATCH_SNAPSHOTS = {
+    "/api/status": "status_cache",
+    "/api/agent-runtime": "agent_runtime_cache",
+    "/api/fleet/overview": "fleet_cache",
+    "/api/alerts": "alerts_cache",
+}
+
+
+def _build_batch_snapshot(paths: list[str]) -> tuple[tuple[bytes, str] | None, str | None]:
+    if not paths:
+        return None, "at least one path is required"
+    if len(paths) > MAX_BATCH_REQUESTS:
+        return None, f"at most {MAX_BATCH_REQUESTS} paths per batch"
+    parts: list[bytes] = []
+    tags: list[str] = []
+    for path in paths:
+        name = _BATCH_SNAPSHOTS.get(path)
+        if name is None:
+            parts.append(_dumps({"path": path, "status": 404, "body": {"detail": f"Not batchable: {path}"}}))
+            tags.append("404")
+            continue
+        body, etag = state.snapshot_bodies[name]
+        # Splice the already-encoded snapshot in rather than re-serializing it.
+        parts.append(b'{"path":' + _dumps(path) + b',"status":200,"body":' + body + b"}")
+        tags.append(etag)
+    # The batch changes exactly when one of its snapshots does, so its ETag is derived
+    # from theirs and conditional polls get 304 like the individual endpoints.
+    etag = _etag_for("\n".join([*paths, *tags]).encode("utf-8"))
+    return (b'{"responses":[' + b",".join(parts) + b"]}", etag), None
+
+
+def _warm_static_cache() -> None:
+    for path in _WEB_FILES.values():
+        _load_static(path)
+
+
+def _parse_session_cookie(raw: str) -> str | None:
+    if not raw:
+        return None
+    match = _SESSION_COOKIE_RE.search(raw)
+    if match is None:
+        return None
+    return match.group(1).strip().strip('"')
+
+
 def _safe_join_web(path: str) -> Path | None:
-    candidate = (WEB_ROOT / path).resolve()
+    known = _WEB_FILES.get(path)
+    if known is not None:
+        return known
+    candidate = (WEB_ROOT_RESOLVED / path).resolve()
     try:
-        candidate.relative_to(WEB_ROOT.resolve())
+        candidate.relative_to(WEB_ROOT_RESOLVED)
     except ValueError:
         return None
     return candidate
@@ -239,20 +632,50 @@ def _safe_join_web(path: str) -> Path | None:
 
 class ConsoleHandler(BaseHTTPRequestHandler):
     server_version = f"OpenClawConsole/{APP_VERSION}"
+    # Buffer the response stream so the status line, headers and body go out in a
+    # single send; the stdlib flushes wfile once the request has been handled.
+    wbufsize = 64 * 1024
+    # Keep-alive lets the UI reuse connections for bursts of requests; every response
+    # carries Content-Length. A kept-alive connection holds its pool worker, so it is
+    # closed after the current response whenever other connections are waiting for a
+    # worker, and dropped once it has been idle for KEEPALIVE_IDLE_SECONDS.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT_SECONDS
+
+    def setup(self) -> None:
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self) -> None:
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._await_next_request():
+            self.handle_one_request()
+
+    def _await_next_request(self) -> bool:
+        if getattr(self.server, "connections_waiting", 0):
+            return False
+        self.connection.settimeout(KEEPALIVE_IDLE_SECONDS)
+        try:
+            # Returns at once for pipelined bytes already buffered; b"" means EOF.
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def parse_request(self) -> bool:
+        if not super().parse_request():
+            return False
+        if getattr(self.server, "connections_waiting", 0):
+            self.close_connection = True
+        return True
 
     def log_message(self, format: str, *args) -> None:
         return
 
     def _read_session_id(self) -> str | None:
-        raw = self.headers.get("Cookie", "")
-        if not raw:
-            return None
-        cookie = SimpleCookie()
-        cookie.load(raw)
-        morsel = cookie.get("clawfleet_session")
-        if morsel is None:
-            return None
-        return morsel.value
+        return _parse_session_cookie(self.headers.get("Cookie", ""))
 
     def _session(self) -> SessionInfo | None:
         if not state.config.security.enable_auth:
@@ -284,6 +707,8 @@ class ConsoleHandler(BaseHTTPRequestHandler):
         return True
 
     def _verify_macos_biometric(self) -> tuple[bool, str]:
+        # Every call prompts: a success is never reused, so one Touch ID cannot
+        # silently authorize a later high-risk operation.
         if platform.system() != "Darwin":
             return False, "biometric verification is only available on macOS"
         command = [
@@ -291,107 +716,41 @@ class ConsoleHandler(BaseHTTPRequestHandler):
             "-e",
             'do shell script "echo clawfleet-auth >/dev/null" with administrator privileges',
         ]
-        result = state.runner.run_local(command, timeout=30)
+        result = _biometric_pool.submit(state.runner.run_local, command, timeout=30).result()
         if result.returncode == 0:
             return True, "biometric verification ok"
         message = result.stderr.strip() or result.stdout.strip() or "biometric verification failed"
         return False, message
 
     def do_GET(self) -> None:
-        parsed = urlparse(self.path)
-        path = parsed.path
+        path = self.path.partition("?")[0]
 
-        if path == "/":
-            self._serve_file("index.html", "text/html; charset=utf-8")
-            return
-        if path == "/sync":
-            self._serve_file("sync.html", "text/html; charset=utf-8")
-            return
-        if path == "/settings":
-            self._serve_file("settings.html", "text/html; charset=utf-8")
-            return
-        if path == "/fleet":
-            self._serve_file("fleet.html", "text/html; charset=utf-8")
-            return
-        if path == "/skills":
-            self._serve_file("skills.html", "text/html; charset=utf-8")
-            return
-        if path == "/cron":
-            self._serve_file("cron.html", "text/html; charset=utf-8")
+        page = _PAGE_ROUTES.get(path)
+        if page is not None:
+            self._serve_file(page, "text/html; charset=utf-8")
             return
         if path.startswith("/web/"):
             rel = path.removeprefix("/web/")
             self._serve_static(rel)
             return
 
-        if path == "/api/auth/me":
-            session = self._session()
-            if session is None:
-                _json_response(self, HTTPStatus.UNAUTHORIZED, {"authenticated": False})
-                return
-            _json_response(
-                self,
-                HTTPStatus.OK,
-                {"authenticated": True, "username": session.username, "csrf_token": session.csrf_token},
-            )
+        public_route = _PUBLIC_GET_ROUTES.get(path)
+        if public_route is not None:
+            public_route(self)
             return
 
         if path.startswith("/api/"):
             if self._auth_required() is None:
                 return
 
-        if path == "/api/status":
-            with state.status_lock:
-                _json_response(self, HTTPStatus.OK, state.status_cache)
-            return
-
-        if path == "/api/config":
-            payload = state.config.to_dict()
-            if payload.get("sync", {}).get("ssh_key_path"):
-                payload["sync"]["ssh_key_path"] = "***"
-            if payload.get("security"):
-                payload["security"]["password"] = "***"
-                payload["security"]["operation_confirm_code"] = "***"
-            _json_response(self, HTTPStatus.OK, payload)
-            return
-        if path == "/api/version":
-            _json_response(self, HTTPStatus.OK, {"version": APP_VERSION})
-            return
-
-        if path == "/api/agent-runtime":
-            with state.runtime_lock:
-                _json_response(self, HTTPStatus.OK, state.agent_runtime_cache)
-            return
-        if path == "/api/fleet/overview":
-            with state.fleet_lock:
-                _json_response(self, HTTPStatus.OK, state.fleet_cache)
-            return
-        if path == "/api/alerts":
-            with state.alerts_lock:
-                _json_response(self, HTTPStatus.OK, state.alerts_cache)
-            return
-        if path == "/api/skills/list":
-            try:
-                payload = list_skills(state.config, state.runner)
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
-            return
-        if path == "/api/cron/list":
-            try:
-                payload = collect_cron_jobs(state.config, state.runner)
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+        route = _GET_ROUTES.get(path)
+        if route is None:
+            _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Not found: {path}"})
             return
-
-        _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Not found: {path}"})
+        route(self)
 
     def do_POST(self) -> None:
-        parsed = urlparse(self.path)
-        path = parsed.path
+        path = self.path.partition("?")[0]
 
         try:
             body = _read_json(self)
@@ -399,42 +758,9 @@ class ConsoleHandler(BaseHTTPRequestHandler):
             _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
             return
 
-        if path == "/api/auth/login":
-            method = str(body.get("method", "password") or "password")
-            username = str(body.get("username", ""))
-            password = str(body.get("password", ""))
-            if method == "biometric":
-                ok, message = self._verify_macos_biometric()
-                if not ok:
-                    _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": message})
-                    return
-                session_username = state.config.security.username or "biometric-user"
-            else:
-                if not state.security.authenticate_credentials(username, password):
-                    _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": "Invalid credentials"})
-                    return
-                session_username = username or state.config.security.username
-            session = state.security.create_session(username=session_username)
-            cookie_value = (
-                f"clawfleet_session={session.session_id}; Path=/; HttpOnly; SameSite=Strict; "
-                f"Max-Age={state.config.security.session_ttl_seconds}"
-            )
-            _json_response(
-                self,
-                HTTPStatus.OK,
-                {"ok": True, "username": session.username, "csrf_token": session.csrf_token, "method": method},
-                extra_headers={"Set-Cookie": cookie_value},
-            )
-            return
-
-        if path == "/api/auth/logout":
-            state.security.remove_session(self._read_session_id())
-            _json_response(
-                self,
-                HTTPStatus.OK,
-                {"ok": True},
-                extra_headers={"Set-Cookie": "clawfleet_session=; Path=/; HttpOnly; SameSite=Strict; Max-Age=0"},
-            )
+        public_route = _PUBLIC_POST_ROUTES.get(path)
+        if public_route is not None:
+            public_route(self, body)
             return
 
         if path.startswith("/api/"):
@@ -443,454 +769,630 @@ class ConsoleHandler(BaseHTTPRequestHandler):
             if not self._csrf_required():
                 return
 
-        high_risk_paths = {
-            "/api/maintenance/update",
-            "/api/maintenance/backup",
-            "/api/skills/install",
-            "/api/skills/copy",
-            "/api/skills/sync",
-            "/api/sync/run",
-        }
-        if path in high_risk_paths:
+        if path in _HIGH_RISK_PATHS:
             if not self._consume_confirm_ticket_or_400(body):
                 return
 
-        if path == "/api/security/confirm":
-            method = str(body.get("method", ""))
-            if not method:
-                method = "biometric" if state.config.security.prefer_macos_biometric else "code"
-            code = body.get("code")
-            if method not in {"biometric", "code"}:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "method must be biometric or code"})
-                return
-            if method == "biometric":
-                ok, message = self._verify_macos_biometric()
-                if not ok:
-                    _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": message})
-                    return
-            else:
-                if not isinstance(code, str) or not code:
-                    _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "code must be non-empty string"})
-                    return
-            try:
-                ticket = state.security.create_confirm_ticket(
-                    code=code if method == "code" else state.config.security.operation_confirm_code
-                )
-            except ValueError:
-                _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": "confirm code invalid"})
-                return
-            _json_response(
-                self,
-                HTTPStatus.OK,
-                {
-                    "ok": True,
-                    "method": method,
-                    "confirm_ticket": ticket,
-                    "expires_in_seconds": state.config.security.confirm_ttl_seconds,
-                },
-            )
+        route = _POST_ROUTES.get(path)
+        if route is None:
+            _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Not found: {path}"})
             return
+        route(self, body)
 
-        if path == "/api/reload-config":
-            try:
-                state.reload_config()
-            except ConfigError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, {"ok": True})
+    def _get_auth_me(self) -> None:
+        session = self._session()
+        if session is None:
+            _json_response(self, HTTPStatus.UNAUTHORIZED, {"authenticated": False})
             return
-        if path == "/api/fleet/node/check":
-            server_name = body.get("server_name")
-            if not isinstance(server_name, str) or not server_name:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server_name must be non-empty string"})
-                return
-            try:
-                payload = run_node_check(state.config, state.runner, server_name)
-            except ValueError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+        _json_response(
+            self,
+            HTTPStatus.OK,
+            {"authenticated": True, "username": session.username, "csrf_token": session.csrf_token},
+        )
+
+    def _get_status(self) -> None:
+        state.note_client_poll()
+        _snapshot_response(self, state.snapshot_bodies["status_cache"])
+
+    def _get_config(self) -> None:
+        _json_body_response(self, HTTPStatus.OK, state.config_public_bytes)
+
+    def _get_version(self) -> None:
+        _json_body_response(self, HTTPStatus.OK, VERSION_BYTES)
+
+    def _get_agent_runtime(self) -> None:
+        state.note_client_poll()
+        _snapshot_response(self, state.snapshot_bodies["agent_runtime_cache"])
+
+    def _get_fleet_overview(self) -> None:
+        state.note_client_poll()
+        _snapshot_response(self, state.snapshot_bodies["fleet_cache"])
+
+    def _get_batch(self) -> None:
+        state.note_client_poll()
+        query = self.path.partition("?")[2]
+        snapshot, error = _build_batch_snapshot([value for key, value in parse_qsl(query) if key == "path"])
+        if snapshot is None:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
             return
-        if path == "/api/alerts/rules/validate":
-            rules = body.get("rules")
-            try:
-                payload = validate_alert_rules(
-                    rules=rules,
-                    server_names=[server.name for server in state.config.servers if server.enabled],
-                )
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            status = HTTPStatus.OK if payload.get("ok") else HTTPStatus.BAD_REQUEST
-            _json_response(self, status, payload)
+        _snapshot_response(self, snapshot)
+
+    def _get_alerts(self) -> None:
+        state.note_client_poll()
+        _snapshot_response(self, state.snapshot_bodies["alerts_cache"])
+
+    def _get_skills_list(self) -> None:
+        try:
+            payload = list_skills(state.config, state.runner)
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
             return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/terminal/open":
-            server_name = str(body.get("server", ""))
-            selected = next(
-                (item for item in state.config.servers if item.ssh_host == server_name or item.name == server_name),
-                None,
-            )
-            if selected is None:
-                _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Unknown server: {server_name}"})
-                return
-            ok, message = open_terminal_for_host(selected.ssh_host, state.config.sync.ssh_key_path)
+    def _get_cron_list(self) -> None:
+        try:
+            payload = collect_cron_jobs(state.config, state.runner)
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
+
+    def _post_auth_login(self, body: dict) -> None:
+        method = str(body.get("method", "password") or "password")
+        username = str(body.get("username", ""))
+        password = str(body.get("password", ""))
+        if method == "biometric":
+            ok, message = self._verify_macos_biometric()
             if not ok:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": message})
+                _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": message})
+                return
+            session_username = state.config.security.username or "biometric-user"
+        else:
+            if not state.security.authenticate_credentials(username, password):
+                _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": "Invalid credentials"})
                 return
-            _json_response(self, HTTPStatus.OK, {"ok": True, "server": selected.ssh_host})
+            session_username = username or state.config.security.username
+        session = state.security.create_session(username=session_username)
+        cookie_value = state.cookie_template.format(sid=session.session_id)
+        _json_response(
+            self,
+            HTTPStatus.OK,
+            {"ok": True, "username": session.username, "csrf_token": session.csrf_token, "method": method},
+            extra_headers={"Set-Cookie": cookie_value},
+        )
+
+    def _post_auth_logout(self, body: dict) -> None:
+        state.security.remove_session(self._read_session_id())
+        _json_response(
+            self,
+            HTTPStatus.OK,
+            {"ok": True},
+            extra_headers={"Set-Cookie": LOGOUT_COOKIE},
+        )
+
+    def _post_security_confirm(self, body: dict) -> None:
+        method = str(body.get("method", ""))
+        if not method:
+            method = "biometric" if state.config.security.prefer_macos_biometric else "code"
+        code = body.get("code")
+        if method not in _CONFIRM_METHODS:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "method must be biometric or code"})
             return
-
-        if path == "/api/maintenance/update":
-            server_name = body.get("server")
-            if server_name is not None and not isinstance(server_name, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server must be string"})
+        if method == "biometric":
+            ok, message = self._verify_macos_biometric()
+            if not ok:
+                _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": message})
                 return
-            try:
-                payload = run_update(state.config, state.runner, server_name)
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+        else:
+            if not isinstance(code, str) or not code:
+                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "code must be non-empty string"})
                 return
-            _json_response(self, HTTPStatus.OK, payload)
+        try:
+            ticket = state.security.create_confirm_ticket(
+                code=code if method == "code" else state.config.security.operation_confirm_code
+            )
+        except ValueError:
+            _json_response(self, HTTPStatus.UNAUTHORIZED, {"detail": "confirm code invalid"})
+            return
+        _json_response(
+            self,
+            HTTPStatus.OK,
+            {
+                "ok": True,
+                "method": method,
+                "confirm_ticket": ticket,
+                "expires_in_seconds": state.config.security.confirm_ttl_seconds,
+            },
+        )
+
+    def _post_reload_config(self, body: dict) -> None:
+        try:
+            state.reload_config()
+        except ConfigError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
             return
+        _json_response(self, HTTPStatus.OK, {"ok": True})
 
-        if path == "/api/maintenance/backup":
-            server_name = body.get("server")
-            if server_name is not None and not isinstance(server_name, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server must be string"})
-                return
-            try:
-                payload = run_backup(state.config, state.runner, server_name)
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_fleet_node_check(self, body: dict) -> None:
+        fields, error = _validate_body(body, _NODE_CHECK_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
             return
+        try:
+            payload = run_node_check(state.config, state.runner, fields["server_name"])
+        except ValueError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/skills/install":
-            server_name = body.get("server")
-            repo_url = body.get("repo_url")
-            prompt = body.get("prompt")
-            market_path = body.get("market_path")
-            market_name = body.get("market_name")
-            if server_name is not None and not isinstance(server_name, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server must be string"})
-                return
-            if repo_url is not None and not isinstance(repo_url, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "repo_url must be string"})
-                return
-            if prompt is not None and not isinstance(prompt, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "prompt must be string"})
-                return
-            if market_path is not None and not isinstance(market_path, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_path must be string"})
-                return
-            if market_name is not None and not isinstance(market_name, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_name must be string"})
-                return
-            if not (repo_url or prompt or market_path):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "repo_url or prompt or market_path is required"})
-                return
-            try:
-                payload = install_skill(
-                    config=state.config,
-                    runner=state.runner,
-                    server=server_name,
-                    repo_url=repo_url.strip() if repo_url else None,
-                    prompt=prompt.strip() if prompt else None,
-                    market_path=market_path.strip() if market_path else None,
-                    market_name=market_name.strip() if market_name else None,
-                )
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_alerts_rules_validate(self, body: dict) -> None:
+        rules = body.get("rules")
+        try:
+            payload = validate_alert_rules(
+                rules=rules,
+                server_names=state.enabled_server_names,
+            )
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        status = HTTPStatus.OK if payload.get("ok") else HTTPStatus.BAD_REQUEST
+        _json_response(self, status, payload)
+
+    def _post_terminal_open(self, body: dict) -> None:
+        server_name = str(body.get("server", ""))
+        selected = state.server_index.get(server_name)
+        if selected is None:
+            _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Unknown server: {server_name}"})
             return
+        ok, message = open_terminal_for_host(selected.ssh_host, state.config.sync.ssh_key_path)
+        if not ok:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": message})
+            return
+        _json_response(self, HTTPStatus.OK, {"ok": True, "server": selected.ssh_host})
 
-        if path == "/api/skills/search-market":
-            prompt = body.get("prompt")
-            limit = body.get("limit", 5)
-            if not isinstance(prompt, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "prompt must be string"})
-                return
-            try:
-                payload = search_market_skills(prompt=prompt, limit=int(limit))
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_maintenance_update(self, body: dict) -> None:
+        fields, error = _validate_body(body, _MAINTENANCE_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
             return
+        try:
+            payload = run_update(state.config, state.runner, fields["server"])
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/skills/market-detail":
-            market_path = body.get("market_path")
-            market_name = body.get("market_name")
-            if market_path is not None and not isinstance(market_path, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_path must be string"})
-                return
-            if market_name is not None and not isinstance(market_name, str):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_name must be string"})
-                return
-            if not (market_path or market_name):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_path or market_name is required"})
-                return
-            try:
-                payload = get_market_skill_detail(
-                    market_path=market_path.strip() if market_path else None,
-                    market_name=market_name.strip() if market_name else None,
-                )
-            except ValueError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_maintenance_backup(self, body: dict) -> None:
+        fields, error = _validate_body(body, _MAINTENANCE_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
+            return
+        try:
+            payload = run_backup(state.config, state.runner, fields["server"])
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
             return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/skills/copy":
-            source_server = body.get("source_server")
-            target_server = body.get("target_server")
-            skill_name = body.get("skill_name")
-            skill_names = body.get("skill_names")
-            if not isinstance(source_server, str) or not source_server:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "source_server must be non-empty string"})
-                return
-            if not isinstance(target_server, str) or not target_server:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "target_server must be non-empty string"})
-                return
-            try:
-                selected_names = _normalize_copy_skill_names(skill_name=skill_name, skill_names=skill_names)
-                payload = copy_skills_between_servers(
-                    config=state.config,
-                    runner=state.runner,
-                    source_server=source_server,
-                    target_server=target_server,
-                    skill_names=selected_names,
-                )
-            except ValueError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_skills_install(self, body: dict) -> None:
+        fields, error = _validate_body(body, _SKILL_INSTALL_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
+            return
+        server_name = fields["server"]
+        repo_url = fields["repo_url"]
+        prompt = fields["prompt"]
+        market_path = fields["market_path"]
+        market_name = fields["market_name"]
+        if not (repo_url or prompt or market_path):
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "repo_url or prompt or market_path is required"})
             return
+        try:
+            payload = install_skill(
+                config=state.config,
+                runner=state.runner,
+                server=server_name,
+                repo_url=repo_url.strip() if repo_url else None,
+                prompt=prompt.strip() if prompt else None,
+                market_path=market_path.strip() if market_path else None,
+                market_name=market_name.strip() if market_name else None,
+            )
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/skills/sync":
-            servers = body.get("servers")
-            if servers is not None:
-                if not isinstance(servers, list) or not all(isinstance(item, str) for item in servers):
-                    _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "servers must be list[string]"})
-                    return
-            try:
-                payload = sync_skills_incremental(
-                    config=state.config,
-                    runner=state.runner,
-                    servers=servers,
-                )
-            except ValueError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_skills_search_market(self, body: dict) -> None:
+        prompt = body.get("prompt")
+        limit = body.get("limit", 5)
+        if not isinstance(prompt, str):
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "prompt must be string"})
             return
+        try:
+            payload = search_market_skills(prompt=prompt, limit=int(limit))
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/cron/detail":
-            server_name = body.get("server")
-            job_id = body.get("job_id")
-            lines = body.get("lines", 200)
-            if not isinstance(server_name, str) or not server_name:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server must be non-empty string"})
-                return
-            if not isinstance(job_id, str) or not job_id:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "job_id must be non-empty string"})
-                return
-            try:
-                payload = get_cron_job_detail(
-                    config=state.config,
-                    runner=state.runner,
-                    server=server_name,
-                    job_id=job_id,
-                    lines=int(lines),
-                )
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_skills_market_detail(self, body: dict) -> None:
+        fields, error = _validate_body(body, _MARKET_DETAIL_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
+            return
+        market_path = fields["market_path"]
+        market_name = fields["market_name"]
+        if not (market_path or market_name):
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "market_path or market_name is required"})
+            return
+        try:
+            payload = get_market_skill_detail(
+                market_path=market_path.strip() if market_path else None,
+                market_name=market_name.strip() if market_name else None,
+            )
+        except ValueError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
             return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/cron/open-output":
-            server_name = body.get("server")
-            remote_path = body.get("remote_path")
-            if not isinstance(server_name, str) or not server_name:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "server must be non-empty string"})
-                return
-            if not isinstance(remote_path, str) or not remote_path:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "remote_path must be non-empty string"})
-                return
-            try:
-                payload = open_cron_output_file(
-                    project_root=PROJECT_ROOT,
-                    config=state.config,
-                    runner=state.runner,
-                    server=server_name,
-                    remote_path=remote_path,
-                )
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
-            _json_response(self, HTTPStatus.OK, payload)
+    def _post_skills_copy(self, body: dict) -> None:
+        fields, error = _validate_body(body, _SKILL_COPY_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
             return
+        source_server = fields["source_server"]
+        target_server = fields["target_server"]
+        skill_name = body.get("skill_name")
+        skill_names = body.get("skill_names")
+        try:
+            selected_names = _normalize_copy_skill_names(skill_name=skill_name, skill_names=skill_names)
+            payload = copy_skills_between_servers(
+                config=state.config,
+                runner=state.runner,
+                source_server=source_server,
+                target_server=target_server,
+                skill_names=selected_names,
+            )
+        except ValueError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-        if path == "/api/sync/plan":
-            mode = str(body.get("mode", ""))
-            if mode not in {"one_way", "bidirectional", "a_to_b", "b_to_a"}:
-                _json_response(
-                    self,
-                    HTTPStatus.BAD_REQUEST,
-                    {"detail": "mode must be one_way|bidirectional|a_to_b|b_to_a"},
-                )
+    def _post_skills_sync(self, body: dict) -> None:
+        servers = body.get("servers")
+        if servers is not None:
+            if not isinstance(servers, list) or not all(isinstance(item, str) for item in servers):
+                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "servers must be list[string]"})
                 return
+        try:
+            payload = sync_skills_incremental(
+                config=state.config,
+                runner=state.runner,
+                servers=servers,
+            )
+        except ValueError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-            roots = body.get("roots")
-            if roots is None:
-                roots = list(state.config.sync.roots)
-            if not isinstance(roots, list) or not all(isinstance(row, str) for row in roots):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "roots must be a list of strings"})
-                return
+    def _post_cron_detail(self, body: dict) -> None:
+        fields, error = _validate_body(body, _CRON_DETAIL_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
+            return
+        server_name = fields["server"]
+        job_id = fields["job_id"]
+        lines = body.get("lines", 200)
+        try:
+            payload = get_cron_job_detail(
+                config=state.config,
+                runner=state.runner,
+                server=server_name,
+                job_id=job_id,
+                lines=int(lines),
+            )
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
+
+    def _post_cron_open_output(self, body: dict) -> None:
+        fields, error = _validate_body(body, _CRON_OUTPUT_FIELDS)
+        if error:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": error})
+            return
+        server_name = fields["server"]
+        remote_path = fields["remote_path"]
+        try:
+            payload = open_cron_output_file(
+                project_root=PROJECT_ROOT,
+                config=state.config,
+                runner=state.runner,
+                server=server_name,
+                remote_path=remote_path,
+            )
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
+            return
+        _json_response(self, HTTPStatus.OK, payload)
 
-            allow_delete = body.get("allow_delete")
-            if allow_delete is None:
-                allow_delete = state.config.sync.allow_delete
-            else:
-                allow_delete = bool(allow_delete)
+    def _post_sync_plan(self, body: dict) -> None:
+        mode = str(body.get("mode", ""))
+        if mode not in _VALID_SYNC_MODES:
+            _json_response(
+                self,
+                HTTPStatus.BAD_REQUEST,
+                {"detail": "mode must be one_way|bidirectional|a_to_b|b_to_a"},
+            )
+            return
 
-            source_server_input = body.get("source_server")
-            target_server_input = body.get("target_server")
+        roots = body.get("roots")
+        if roots is None:
+            # Already validated at config load.
+            roots = state.config.sync.roots
+        elif type(roots) is not list or set(map(type, roots)) - {str}:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "roots must be a list of strings"})
+            return
 
-            try:
-                source_server, target_server = _resolve_sync_servers(
-                    config=state.config,
-                    mode=mode,
-                    source_server_input=source_server_input,
-                    target_server_input=target_server_input,
-                )
-            except ValueError as exc:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
-                return
+        allow_delete = body.get("allow_delete")
+        if allow_delete is None:
+            allow_delete = state.config.sync.allow_delete
+        else:
+            allow_delete = bool(allow_delete)
 
-            source_host = source_server.ssh_host
-            target_host = target_server.ssh_host
-            plan_mode = "bidirectional" if mode == "bidirectional" else "a_to_b"
+        source_server_input = body.get("source_server")
+        target_server_input = body.get("target_server")
 
-            try:
-                plan = build_plan(
-                    runner=state.runner,
-                    mode=plan_mode,
-                    source_host=source_host,
-                    target_host=target_host,
-                    roots=roots,
-                    excludes=state.config.sync.excludes,
-                    allow_delete=allow_delete,
-                )
-                plan["source_server"] = source_server.name
-                plan["target_server"] = target_server.name
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
+        try:
+            source_server, target_server = _resolve_sync_servers(
+                config=state.config,
+                mode=mode,
+                source_server_input=source_server_input,
+                target_server_input=target_server_input,
+                server_index=state.server_index,
+            )
+        except ValueError as exc:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return
 
-            plan_id = secrets.token_hex(12)
-            with state.plans_lock:
-                state.plans[plan_id] = {
-                    "plan_id": plan_id,
-                    "plan": plan,
-                    "allow_delete": allow_delete,
-                    "excludes": list(state.config.sync.excludes),
-                }
+        source_host = source_server.ssh_host
+        target_host = target_server.ssh_host
+        plan_mode = "bidirectional" if mode == "bidirectional" else "a_to_b"
 
-            _json_response(self, HTTPStatus.OK, {"plan_id": plan_id, **plan})
+        try:
+            plan = build_plan(
+                runner=state.runner,
+                mode=plan_mode,
+                source_host=source_host,
+                target_host=target_host,
+                roots=roots,
+                excludes=state.config.sync.excludes,
+                allow_delete=allow_delete,
+            )
+            plan["source_server"] = source_server.name
+            plan["target_server"] = target_server.name
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
             return
 
-        if path == "/api/sync/run":
-            plan_id = body.get("plan_id")
-            if not isinstance(plan_id, str) or not plan_id:
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "plan_id is required"})
-                return
+        plan_id = binascii.hexlify(os.urandom(12)).decode("ascii")
+        entry = {
+            "plan_id": plan_id,
+            "plan": plan,
+            "allow_delete": allow_delete,
+            "excludes": state.config.sync.excludes,
+        }
+        state.plans[plan_id] = entry
+        if len(state.plans) > MAX_SYNC_PLANS:
+            state.plans.popitem(last=False)
 
-            with state.plans_lock:
-                item = state.plans.get(plan_id)
-            if item is None:
-                _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Unknown plan_id: {plan_id}"})
-                return
+        _json_response(self, HTTPStatus.OK, {"plan_id": plan_id, **plan})
 
-            conflict_resolutions = body.get("conflict_resolutions", [])
-            if not isinstance(conflict_resolutions, list):
-                _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "conflict_resolutions must be a list"})
-                return
+    def _post_sync_run(self, body: dict) -> None:
+        plan_id = body.get("plan_id")
+        if not isinstance(plan_id, str) or not plan_id:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "plan_id is required"})
+            return
 
-            try:
-                result = execute_plan(
-                    runner=state.runner,
-                    plan=item["plan"],
-                    excludes=item["excludes"],
-                    allow_delete=item["allow_delete"],
-                    conflict_resolutions=conflict_resolutions,
-                )
-            except Exception as exc:
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
-                return
+        item = state.plans.get(plan_id)
+        if item is None:
+            _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Unknown plan_id: {plan_id}"})
+            return
 
-            if not result.get("ok"):
-                _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": result})
-                return
+        conflict_resolutions = body.get("conflict_resolutions", [])
+        if type(conflict_resolutions) is not list:
+            _json_response(self, HTTPStatus.BAD_REQUEST, {"detail": "conflict_resolutions must be a list"})
+            return
 
-            _json_response(self, HTTPStatus.OK, result)
+        try:
+            result = execute_plan(
+                runner=state.runner,
+                plan=item["plan"],
+                excludes=item["excludes"],
+                allow_delete=item["allow_delete"],
+                conflict_resolutions=conflict_resolutions,
+            )
+        except Exception as exc:
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(exc)})
             return
 
-        _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Not found: {path}"})
+        if not result.get("ok"):
+            _json_response(self, HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": result})
+            return
+
+        _json_response(self, HTTPStatus.OK, result)
 
     def _serve_static(self, rel: str) -> None:
-        path = _safe_join_web(rel)
-        if path is None or not path.exists() or not path.is_file():
+        ctype = _STATIC_CONTENT_TYPES.get(rel[rel.rfind("."):], "text/plain; charset=utf-8")
+        if not self._serve_web_path(_safe_join_web(rel), ctype):
             _json_response(self, HTTPStatus.NOT_FOUND, {"detail": "Static file not found"})
-            return
-        ctype = "text/plain; charset=utf-8"
-        if rel.endswith(".js"):
-            ctype = "application/javascript; charset=utf-8"
-        elif rel.endswith(".css"):
-            ctype = "text/css; charset=utf-8"
-        elif rel.endswith(".html"):
-            ctype = "text/html; charset=utf-8"
-        data = path.read_bytes()
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", ctype)
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
 
     def _serve_file(self, filename: str, ctype: str) -> None:
-        path = _safe_join_web(filename)
-        if path is None or not path.exists() or not path.is_file():
+        if not self._serve_web_path(_safe_join_web(filename), ctype):
             _json_response(self, HTTPStatus.NOT_FOUND, {"detail": f"Missing page: {filename}"})
-            return
-        data = path.read_bytes()
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", ctype)
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+
+    def _serve_web_path(self, path: Path | None, ctype: str) -> bool:
+        if path is None:
+            return False
+        entry = _load_static(path)
+        if entry is not None:
+            body, etag, gzipped = entry
+            encoding = ""
+            if gzipped is not None and _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                body, etag = gzipped
+                encoding = "gzip"
+            if _etag_matches(self.headers.get("If-None-Match", ""), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                if self.close_connection:
+                    self.send_header("Connection", "close")
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                if gzipped is not None:
+                    self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return True
+            self.send_response(HTTPStatus.OK)
+            if self.close_connection:
+                self.send_header("Connection", "close")
+            for name, value in _static_headers(ctype, len(body), etag, encoding, gzipped is not None):
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+            return True
+        # Files too large for the in-memory cache are streamed from disk.
+        try:
+            handle = path.open("rb")
+        except OSError:
+            return False
+        with handle:
+            info = os.fstat(handle.fileno())
+            if not stat.S_ISREG(info.st_mode):
+                return False
+            self.send_response(HTTPStatus.OK)
+            if self.close_connection:
+                self.send_header("Connection", "close")
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(info.st_size))
+            self.end_headers()
+            self.wfile.flush()
+            # socket.sendfile uses os.sendfile where available and falls back to send().
+            self.connection.sendfile(handle, 0, info.st_size)
+        return True
+
+
+_PAGE_ROUTES = {
+    "/": "index.html",
+    "/sync": "sync.html",
+    "/settings": "settings.html",
+    "/fleet": "fleet.html",
+    "/skills": "skills.html",
+    "/cron": "cron.html",
+}
+_PUBLIC_GET_ROUTES = {
+    "/api/auth/me": ConsoleHandler._get_auth_me,
+}
+_GET_ROUTES = {
+    "/api/status": ConsoleHandler._get_status,
+    "/api/config": ConsoleHandler._get_config,
+    "/api/version": ConsoleHandler._get_version,
+    "/api/agent-runtime": ConsoleHandler._get_agent_runtime,
+    "/api/fleet/overview": ConsoleHandler._get_fleet_overview,
+    "/api/alerts": ConsoleHandler._get_alerts,
+    "/api/batch": ConsoleHandler._get_batch,
+    "/api/skills/list": ConsoleHandler._get_skills_list,
+    "/api/cron/list": ConsoleHandler._get_cron_list,
+}
+_PUBLIC_POST_ROUTES = {
+    "/api/auth/login": ConsoleHandler._post_auth_login,
+    "/api/auth/logout": ConsoleHandler._post_auth_logout,
+}
+_POST_ROUTES = {
+    "/api/security/confirm": ConsoleHandler._post_security_confirm,
+    "/api/reload-config": ConsoleHandler._post_reload_config,
+    "/api/fleet/node/check": ConsoleHandler._post_fleet_node_check,
+    "/api/alerts/rules/validate": ConsoleHandler._post_alerts_rules_validate,
+    "/api/terminal/open": ConsoleHandler._post_terminal_open,
+    "/api/maintenance/update": ConsoleHandler._post_maintenance_update,
+    "/api/maintenance/backup": ConsoleHandler._post_maintenance_backup,
+    "/api/skills/install": ConsoleHandler._post_skills_install,
+    "/api/skills/search-market": ConsoleHandler._post_skills_search_market,
+    "/api/skills/market-detail": ConsoleHandler._post_skills_market_detail,
+    "/api/skills/copy": ConsoleHandler._post_skills_copy,
+    "/api/skills/sync": ConsoleHandler._post_skills_sync,
+    "/api/cron/detail": ConsoleHandler._post_cron_detail,
+    "/api/cron/open-output": ConsoleHandler._post_cron_open_output,
+    "/api/sync/plan": ConsoleHandler._post_sync_plan,
+    "/api/sync/run": ConsoleHandler._post_sync_run,
+}
+_CONFIRM_METHODS = frozenset(("biometric", "code"))
+_VALID_SYNC_MODES = frozenset(("one_way", "bidirectional", "a_to_b", "b_to_a"))
+_HIGH_RISK_PATHS = frozenset({
+    "/api/maintenance/update",
+    "/api/maintenance/backup",
+    "/api/skills/install",
+    "/api/skills/copy",
+    "/api/skills/sync",
+    "/api/sync/run",
+})
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """Serve requests on a fixed pool of worker threads instead of one thread per request."""
+
+    def __init__(self, server_address: tuple[str, int], handler_class: type, max_workers: int) -> None:
+        super().__init__(server_address, handler_class)
+        # Accepted connections not yet picked up by a worker; handlers stop keeping
+        # their connection alive while this is non-zero.
+        self.connections_waiting = 0
+        self._waiting_lock = threading.Lock()
+        self._connections: queue.SimpleQueue = queue.SimpleQueue()
+        # Daemon threads, like ThreadingHTTPServer.daemon_threads: exiting the process
+        # must not wait for in-flight handlers such as long SSH maintenance calls.
+        self._workers = [
+            threading.Thread(target=self._serve_connections, name=f"http-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request, client_address) -> None:
+        with self._waiting_lock:
+            self.connections_waiting += 1
+        self._connections.put((request, client_address))
+
+    def _serve_connections(self) -> None:
+        while True:
+            item = self._connections.get()
+            if item is None:
+                return
+            with self._waiting_lock:
+                self.connections_waiting -= 1
+            self.process_request_thread(*item)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _ in self._workers:
+            self._connections.put(None)
 
 
-def run(host: str = "127.0.0.1", port: int = 8088) -> None:
-    thread = threading.Thread(target=_refresh_status_loop, daemon=True)
-    thread.start()
+def run(host: str = "127.0.0.1", port: int = 8088, workers: int | None = None) -> None:
+    refresh_thread = threading.Thread(target=_refresh_status_loop, daemon=True)
+    refresh_thread.start()
+    _warm_static_cache()
 
-    server = ThreadingHTTPServer((host, port), ConsoleHandler)
+    server = PooledHTTPServer((host, port), ConsoleHandler, workers or state.config.server.max_workers)
     print(f"OpenClaw console listening on http://{host}:{port}")
     try:
         server.serve_forever()
@@ -898,16 +1400,25 @@ def run(host: str = "127.0.0.1", port: int = 8088) -> None:
         pass
     finally:
         state.stop_event.set()
+        state.wake_event.set()
         server.server_close()
-        time.sleep(0.1)
+        refresh_thread.join(timeout=1.0)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="OpenClaw Tencent Console")
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="HTTP worker threads (defaults to server.max_workers from config)",
+    )
     args = parser.parse_args()
-    run(host=args.host, port=args.port)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be >= 1")
+    run(host=args.host, port=args.port, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -9,15 +10,15 @@ from app.ssh_runner import SSHRunner
 
 def _resolve_servers(config: AppConfig, server: str | None) -> list:
     if server in {None, "", "all"}:
-        return list(config.servers)
+        # Callers only iterate the result, so the configured list is shared as is.
+        return config.servers
     selected = [item for item in config.servers if item.name == server or item.ssh_host == server]
     if not selected:
         raise ValueError(f"Unknown server: {server}")
     return selected
 
 
-def _update_command() -> str:
-    return r"""bash -lc '
+_UPDATE_COMMAND = r"""bash -lc '
 set +e
 NOW="$(date -u +%Y-%m-%dT%H:%M:%SZ)"
 echo "started_at=$NOW"
@@ -44,8 +45,7 @@ echo "status=done"
 '"""
 
 
-def _backup_command() -> str:
-    return r"""bash -lc '
+_BACKUP_COMMAND = r"""bash -lc '
 set -e
 TS="$(date -u +%Y%m%dT%H%M%SZ)"
 BACKUP_DIR="/root/files/openclaw-backups"
@@ -57,11 +57,12 @@ echo "status=done"
 '"""
 
 
-def run_update(config: AppConfig, runner: SSHRunner, server: str | None) -> dict[str, Any]:
-    output: dict[str, Any] = {"action": "update", "generated_at": datetime.now(timezone.utc).isoformat(), "servers": {}}
-    for item in _resolve_servers(config, server):
-        result = runner.run_ssh(item.ssh_host, _update_command(), timeout=240)
-        output["servers"][item.name] = {
+def _run_on_servers(config: AppConfig, runner: SSHRunner, server: str | None, command: str, timeout: int) -> dict[str, dict[str, Any]]:
+    servers = _resolve_servers(config, server)
+
+    def run_one(item) -> dict[str, Any]:
+        result = runner.run_ssh(item.ssh_host, command, timeout=timeout)
+        return {
             "server_name": item.name,
             "ssh_host": item.ssh_host,
             "ok": result.returncode == 0,
@@ -69,19 +70,20 @@ def run_update(config: AppConfig, runner: SSHRunner, server: str | None) -> dict
             "stdout": result.stdout.strip(),
             "stderr": result.stderr.strip(),
         }
-    return output
+
+    # Each host is independent, so the slowest server bounds the wall time.
+    with ThreadPoolExecutor(max_workers=min(16, len(servers) or 1)) as pool:
+        results = pool.map(run_one, servers)
+        return {item.name: row for item, row in zip(servers, results)}
+
+
+def run_update(config: AppConfig, runner: SSHRunner, server: str | None) -> dict[str, Any]:
+    generated_at = datetime.now(timezone.utc).isoformat()
+    servers = _run_on_servers(config, runner, server, _UPDATE_COMMAND, timeout=240)
+    return {"action": "update", "generated_at": generated_at, "servers": servers}
 
 
 def run_backup(config: AppConfig, runner: SSHRunner, server: str | None) -> dict[str, Any]:
-    output: dict[str, Any] = {"action": "backup", "generated_at": datetime.now(timezone.utc).isoformat(), "servers": {}}
-    for item in _resolve_servers(config, server):
-        result = runner.run_ssh(item.ssh_host, _backup_command(), timeout=180)
-        output["servers"][item.name] = {
-            "server_name": item.name,
-            "ssh_host": item.ssh_host,
-            "ok": result.returncode == 0,
-            "returncode": result.returncode,
-            "stdout": result.stdout.strip(),
-            "stderr": result.stderr.strip(),
-        }
-    return output
+    generated_at = datetime.now(timezone.utc).isoformat()
+    servers = _run_on_servers(config, runner, server, _BACKUP_COMMAND, timeout=180)
+    return {"action": "backup", "generated_at": generated_at, "servers": servers}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from typing import Literal
@@ -18,7 +19,7 @@ class FileRecord:
     sha256: str
 
 
-def _manifest_command(root: str, excludes: list[str]) -> str:
+def _manifest_command(root: str, excludes: Sequence[str]) -> str:
     return rf'''python3 - <<'PY'
 import hashlib
 import json
@@ -121,7 +122,7 @@ def _find_conflicts(a_to_b: dict[str, list[dict]], b_to_a: dict[str, list[dict]]
     return out
 
 
-def _collect_manifest(runner: SSHRunner, host: str, root: str, excludes: list[str]) -> dict[str, FileRecord]:
+def _collect_manifest(runner: SSHRunner, host: str, root: str, excludes: Sequence[str]) -> dict[str, FileRecord]:
     cmd = _manifest_command(root, excludes)
     result = runner.run_ssh(host, cmd, timeout=240)
     if result.returncode != 0:
@@ -135,8 +136,8 @@ def build_plan(
     mode: str,
     source_host: str,
     target_host: str,
-    roots: list[str],
-    excludes: list[str],
+    roots: Sequence[str],
+    excludes: Sequence[str],
     allow_delete: bool,
 ) -> dict:
     by_root: dict[str, dict] = {}
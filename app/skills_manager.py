@@ -20,7 +20,8 @@ OPENCLAW_SKILLS_ROOT = "/root/.openclaw/workspace/skills"
 
 def _resolve_servers(config: AppConfig, server: str | None) -> list[ServerConfig]:
     if server in {None, "", "all"}:
-        return list(config.servers)
+        # Callers only iterate the result, so the configured list is shared as is.
+        return config.servers
     selected = [item for item in config.servers if item.name == server or item.ssh_host == server]
     if not selected:
         raise ValueError(f"Unknown server: {server}")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 
@@ -11,11 +13,20 @@ class CommandResult:
     stderr: str
 
 
+CONTROL_PATH = "~/.ssh/cm-%C"
+CONTROL_PERSIST_SECONDS = 600
+
+
 class SSHRunner:
-    def __init__(self, ssh_key_path: str | None = None):
+    def __init__(self, ssh_key_path: str | None = None, multiplex: bool = True):
         self.ssh_key_path = ssh_key_path
+        self.multiplex = multiplex
+        self._options = tuple(self._build_options())
 
     def ssh_options(self) -> list[str]:
+        return list(self._options)
+
+    def _build_options(self) -> list[str]:
         options = [
             "-o",
             "IdentitiesOnly=yes",
@@ -28,12 +39,24 @@ class SSHRunner:
             "-o",
             "ConnectTimeout=10",
         ]
+        if self.multiplex:
+            # Reuse one authenticated master connection per host across polls.
+            options.extend(
+                [
+                    "-o",
+                    "ControlMaster=auto",
+                    "-o",
+                    f"ControlPersist={CONTROL_PERSIST_SECONDS}",
+                    "-o",
+                    f"ControlPath={CONTROL_PATH}",
+                ]
+            )
         if self.ssh_key_path:
             options.extend(["-i", self.ssh_key_path])
         return options
 
     def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
-        cmd = ["ssh", *self.ssh_options(), host, remote_command]
+        cmd = ["ssh", *self._options, host, remote_command]
         try:
             completed = subprocess.run(cmd, text=True, capture_output=True, timeout=timeout)
             return CommandResult(
@@ -46,6 +69,24 @@ class SSHRunner:
         except FileNotFoundError:
             return CommandResult(returncode=127, stdout="", stderr="ssh binary not found")
 
+    def close_masters(self, hosts: list[str]) -> threading.Thread | None:
+        """Ask the multiplexed master for each host to exit, e.g. after the key changed.
+
+        Runs in the background so the caller (a config reload request) does not wait on it.
+        """
+        if not self.multiplex or not hosts:
+            return None
+
+        def exit_all() -> None:
+            with ThreadPoolExecutor(max_workers=min(16, len(hosts))) as pool:
+                for host in hosts:
+                    # Only talks to the local control socket; fails fast when no master is running.
+                    pool.submit(self.run_local, ["ssh", *self._options, "-O", "exit", host], 5)
+
+        thread = threading.Thread(target=exit_all, name="ssh-master-exit", daemon=True)
+        thread.start()
+        return thread
+
     def run_local(self, command: list[str], timeout: int = 60) -> CommandResult:
         try:
             completed = subprocess.run(command, text=True, capture_output=True, timeout=timeout)
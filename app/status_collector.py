@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import atexit
+from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -10,6 +12,13 @@ from app.config import AppConfig, ServerConfig
 from app.ssh_runner import SSHRunner
 
 
+# Long-lived and capped: the refresh loop reuses these threads every tick, and a
+# large fleet is probed at most STATUS_MAX_PARALLEL hosts at a time.
+STATUS_MAX_PARALLEL = 32
+_STATUS_POOL = ThreadPoolExecutor(max_workers=STATUS_MAX_PARALLEL, thread_name_prefix="status-collect")
+atexit.register(_STATUS_POOL.shutdown, wait=False)
+
+
 @dataclass
 class ServerStatus:
     server: str
@@ -19,7 +28,7 @@ class ServerStatus:
     error: str | None = None
 
 
-def build_remote_status_command(server: ServerConfig, sync_roots: list[str]) -> str:
+def build_remote_status_command(server: ServerConfig, sync_roots: Sequence[str]) -> str:
     roots = " ".join(f'"{root}"' for root in sync_roots)
     cmd = rf'''bash -lc '
 set +e
@@ -44,7 +53,7 @@ done
     return cmd
 
 
-def collect_server_status(runner: SSHRunner, server: ServerConfig, sync_roots: list[str]) -> ServerStatus:
+def collect_server_status(runner: SSHRunner, server: ServerConfig, sync_roots: Sequence[str]) -> ServerStatus:
     now = datetime.now(timezone.utc).isoformat()
     try:
         ping_start = time.perf_counter()
@@ -96,30 +105,29 @@ def collect_all_status(config: AppConfig, runner: SSHRunner) -> dict[str, dict]:
     enabled_servers = [server for server in config.servers if server.enabled]
     if not enabled_servers:
         return payload
-    with ThreadPoolExecutor(max_workers=len(enabled_servers)) as pool:
-        futures = {
-            pool.submit(collect_server_status, runner, server, config.sync.roots): server
-            for server in enabled_servers
-        }
-        for future in as_completed(futures):
-            server = futures[future]
-            try:
-                status = future.result()
-            except Exception as exc:
-                now = datetime.now(timezone.utc).isoformat()
-                payload[server.name] = {
-                    "server": server.name,
-                    "reachable": False,
-                    "captured_at": now,
-                    "details": {},
-                    "error": f"future error: {exc}",
-                }
-                continue
-            payload[status.server] = {
-                "server": status.server,
-                "reachable": status.reachable,
-                "captured_at": status.captured_at,
-                "details": status.details,
-                "error": status.error,
+    futures = {
+        _STATUS_POOL.submit(collect_server_status, runner, server, config.sync.roots): server
+        for server in enabled_servers
+    }
+    for future in as_completed(futures):
+        server = futures[future]
+        try:
+            status = future.result()
+        except Exception as exc:
+            now = datetime.now(timezone.utc).isoformat()
+            payload[server.name] = {
+                "server": server.name,
+                "reachable": False,
+                "captured_at": now,
+                "details": {},
+                "error": f"future error: {exc}",
             }
+            continue
+        payload[status.server] = {
+            "server": status.server,
+            "reachable": status.reachable,
+            "captured_at": status.captured_at,
+            "details": status.details,
+            "error": status.error,
+        }
     return payload
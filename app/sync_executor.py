@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -17,7 +18,7 @@ def _build_ssh_command(runner: SSHRunner) -> str:
     return " ".join(pieces)
 
 
-def _write_exclude_file(base: Path, excludes: list[str], extra_paths: list[str]) -> Path:
+def _write_exclude_file(base: Path, excludes: Sequence[str], extra_paths: list[str]) -> Path:
     target = base / "exclude.lst"
     lines = [*excludes]
     for path in extra_paths:
@@ -80,7 +81,7 @@ def execute_single_direction(
     source_host: str,
     target_host: str,
     root: str,
-    excludes: list[str],
+    excludes: Sequence[str],
     allow_delete: bool,
     skip_paths: list[str] | None = None,
 ) -> dict:
@@ -146,7 +147,7 @@ def execute_single_direction(
 def execute_plan(
     runner: SSHRunner,
     plan: dict,
-    excludes: list[str],
+    excludes: Sequence[str],
     allow_delete: bool,
     conflict_resolutions: list[dict],
 ) -> dict:
@@ -1,10 +1,19 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import agent_runtime_collector
 from app.agent_runtime_collector import (
+    COLLECT_DEADLINE_SECONDS,
+    _collect_pool_for,
+    collect_agent_runtime_all,
+    collect_server_agent_runtime,
     is_error_line,
     normalize_subagent_name,
     parse_runtime_payload,
     summarize_timeseries,
 )
-from app.config import ServerConfig
+from app.config import AppConfig, ServerConfig, SyncConfig
+from app.ssh_runner import CommandResult
 
 
 def test_summarize_timeseries() -> None:
@@ -47,3 +56,101 @@ def test_parse_runtime_payload() -> None:
     assert status.agent_timeseries[0]["sessions"] == 1
     assert status.agent_rank[0]["agent"] == "main"
     assert status.subagent_rank[0]["subagent"] == "embedded"
+
+
+class _UnreachableRunner:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.timeout = None
+
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        self.calls += 1
+        self.timeout = timeout
+        return CommandResult(returncode=255, stdout="", stderr="")
+
+
+def test_collect_server_agent_runtime_reports_unreachable_in_single_call() -> None:
+    runner = _UnreachableRunner()
+    server = ServerConfig(name="server-a", ssh_host="<SSH_USER>@203.0.113.10")
+    status = collect_server_agent_runtime(runner, server, window_hours=24)
+    assert runner.calls == 1
+    assert runner.timeout == COLLECT_DEADLINE_SECONDS
+    assert status.errors == ["SSH not reachable"]
+    assert status.agent_timeseries == []
+
+
+class _ReadyRunner:
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        assert remote_command.startswith("echo __READY__ && python3 - <<'PY'")
+        return CommandResult(
+            returncode=0,
+            stdout='__READY__\n{"window_hours":24,"agent_timeseries":[],"agent_rank":[],"subagent_rank":[],"errors":[]}\n',
+            stderr="",
+        )
+
+
+def test_collect_server_agent_runtime_splits_ready_sentinel() -> None:
+    server = ServerConfig(name="server-a", ssh_host="<SSH_USER>@203.0.113.10")
+    status = collect_server_agent_runtime(_ReadyRunner(), server, window_hours=24)
+    assert status.errors == []
+    assert status.window_hours == 24
+
+
+def test_collect_agent_runtime_all_reuses_shared_pool() -> None:
+    config = AppConfig(
+        poll_interval_seconds=5,
+        servers=[
+            ServerConfig(name="server-a", ssh_host="<SSH_USER>@203.0.113.10"),
+            ServerConfig(name="server-b", ssh_host="<SSH_USER>@203.0.113.11"),
+        ],
+        sync=SyncConfig(),
+    )
+    first = collect_agent_runtime_all(config, _ReadyRunner(), window_hours=24)
+    second = collect_agent_runtime_all(config, _ReadyRunner(), window_hours=24)
+    assert sorted(first) == sorted(second) == ["server-a", "server-b"]
+    assert all(entry["errors"] == [] for entry in [*first.values(), *second.values()])
+
+
+def test_collect_pool_grows_with_the_fleet() -> None:
+    small = _collect_pool_for(2)
+    assert _collect_pool_for(3) is small
+    large = _collect_pool_for(40)
+    assert large is not small and large._max_workers == 80
+    assert _collect_pool_for(5) is large
+
+
+def test_collect_server_agent_runtime_opens_circuit_after_repeated_failures() -> None:
+    runner = _UnreachableRunner()
+    server = ServerConfig(name="server-flaky", ssh_host="<SSH_USER>@203.0.113.99")
+    for _ in range(3):
+        collect_server_agent_runtime(runner, server, window_hours=24)
+    skipped = collect_server_agent_runtime(runner, server, window_hours=24)
+    assert runner.calls == 3
+    assert "consecutive failures" in skipped.errors[0]
+
+
+class _SlowReadyRunner(_ReadyRunner):
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        time.sleep(0.5)
+        return super().run_ssh(host, remote_command, timeout)
+
+
+def test_collect_agent_runtime_all_deadline_counts_each_attempt_once(monkeypatch) -> None:
+    single = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(agent_runtime_collector, "COLLECT_DEADLINE_SECONDS", 0.2)
+    monkeypatch.setattr(agent_runtime_collector, "_collect_pool_for", lambda count: single)
+    config = AppConfig(
+        poll_interval_seconds=5,
+        servers=[
+            ServerConfig(name="slow-running", ssh_host="<SSH_USER>@203.0.113.20"),
+            ServerConfig(name="slow-queued", ssh_host="<SSH_USER>@203.0.113.21"),
+        ],
+        sync=SyncConfig(),
+    )
+    payload = collect_agent_runtime_all(config, _SlowReadyRunner(), window_hours=24)
+    assert payload["slow-running"]["errors"] == ["runtime collection exceeded 0.2s"]
+    assert payload["slow-queued"]["errors"] == ["runtime collection did not start within 0.2s"]
+    single.shutdown(wait=True)
+    # The late call succeeded and the queued host never ran: neither counts as a failure.
+    assert "slow-running" not in agent_runtime_collector._failure_streak
+    assert "slow-queued" not in agent_runtime_collector._failure_streak
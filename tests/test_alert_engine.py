@@ -1,4 +1,4 @@
-from app.alert_engine import evaluate_alerts, validate_alert_rules
+from app.alert_engine import _event_id, evaluate_alerts, validate_alert_rules
 from app.config import AlertsConfig, AppConfig, ServerConfig, SyncConfig
 
 
@@ -61,3 +61,58 @@ def test_validate_alert_rules() -> None:
     assert bad["ok"] is False
     assert len(bad["errors"]) >= 3
 
+
+def test_event_id_is_stable_16_hex_chars() -> None:
+    first = _event_id("cloud-a", "gw", "Gateway status is inactive")
+    assert first == _event_id("cloud-a", "gw", "Gateway status is inactive")
+    assert len(first) == 16
+    assert first != _event_id("edge-1", "gw", "Gateway status is inactive")
+
+
+def test_evaluate_alerts_summary_counts_by_severity_and_server() -> None:
+    status_cache = {
+        "servers": {
+            "cloud-a": {"reachable": True, "details": {"gateway_status": "inactive"}},
+            "edge-1": {"reachable": True, "details": {"gateway_status": "inactive"}},
+        }
+    }
+    payload = evaluate_alerts(_config(), status_cache=status_cache, runtime_cache={"servers": {}})
+    summary = payload["summary"]
+    assert summary["total"] == 2
+    assert summary["critical"] == 2
+    assert summary["warning"] == 0
+    assert summary["info"] == 0
+    assert summary["by_server"] == {"cloud-a": 1, "edge-1": 1}
+
+
+def test_evaluate_alerts_respects_target_servers_and_reuses_rules() -> None:
+    config = _config()
+    config.alerts.rules = [
+        {"name": "down", "type": "unreachable", "severity": "critical", "target_servers": ["edge-1"]},
+    ]
+    status_cache = {"servers": {"cloud-a": {"reachable": False}, "edge-1": {"reachable": False}}}
+    first = evaluate_alerts(config, status_cache=status_cache, runtime_cache={})
+    second = evaluate_alerts(config, status_cache=status_cache, runtime_cache={})
+    assert [event["server"] for event in first["events"]] == ["edge-1"]
+    assert first["rules"] is second["rules"]
+
+
+def test_evaluate_alerts_disk_rule_tiers_share_highest_usage() -> None:
+    config = _config()
+    config.alerts.rules = [
+        {"name": "disk-warn", "type": "disk_usage_percent", "severity": "warning", "threshold": 80},
+        {"name": "disk-crit", "type": "disk_usage_percent", "severity": "critical", "threshold": 95},
+    ]
+    status_cache = {
+        "servers": {
+            "cloud-a": {
+                "reachable": True,
+                "details": {
+                    "disk__root_files": "/dev/vda1 40G 35G 5G 88% /root/files",
+                    "disk__root": "/dev/vda2 40G 10G 30G 25% /",
+                },
+            },
+        }
+    }
+    payload = evaluate_alerts(config, status_cache=status_cache, runtime_cache={})
+    assert [(event["rule_name"], event["value"]) for event in payload["events"]] == [("disk-warn", 88)]
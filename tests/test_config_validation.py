@@ -1,6 +1,6 @@
 import pytest
 
-from app.config import ConfigError, _validate
+from app.config import ConfigError, _merge_dict, _validate, load_config
 
 
 def _base_config() -> dict:
@@ -52,3 +52,44 @@ def test_validate_rejects_invalid_security_ttl() -> None:
     payload["security"] = {"session_ttl_seconds": 10}
     with pytest.raises(ConfigError, match="security\\.session_ttl_seconds must be >= 60"):
         _validate(payload)
+
+
+def test_validate_http_server_workers() -> None:
+    payload = _base_config()
+    assert _validate(payload).server.max_workers == 16
+    payload["server"] = {"max_workers": 0}
+    with pytest.raises(ConfigError, match="server\\.max_workers must be >= 1"):
+        _validate(payload)
+
+
+def test_validate_freezes_sync_roots_and_excludes() -> None:
+    payload = _base_config()
+    assert _validate(payload).sync.roots == ("/root/files",)
+    assert _validate(payload).sync.excludes == ("**/.env",)
+    del payload["sync"]["excludes"]
+    assert "**/.env" in _validate(payload).sync.excludes
+
+
+def test_merge_dict_merges_nested_without_mutating_base() -> None:
+    base = {"sync": {"roots": ["/a"], "allow_delete": False}, "poll_interval_seconds": 5}
+    merged = _merge_dict(base, {"sync": {"allow_delete": True}, "servers": []})
+    assert merged == {
+        "sync": {"roots": ["/a"], "allow_delete": True},
+        "poll_interval_seconds": 5,
+        "servers": [],
+    }
+    assert base["sync"]["allow_delete"] is False
+
+
+def test_load_config_rereads_file_on_every_call(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    template = (
+        "poll_interval_seconds: {}\n"
+        "servers:\n"
+        "  - name: server-1\n"
+        "    ssh_host: <SSH_USER>@203.0.113.10\n"
+    )
+    config_path.write_text(template.format(5))
+    assert load_config(tmp_path).poll_interval_seconds == 5
+    config_path.write_text(template.format(7))
+    assert load_config(tmp_path).poll_interval_seconds == 7
@@ -0,0 +1,102 @@
+import json
+import threading
+
+from app.config import AppConfig, ServerConfig, SyncConfig
+from app.cron_manager import REMOTE_SCRIPT_DIR, collect_cron_jobs, get_cron_job_detail, invalidate_cron_cache
+from app.ssh_runner import CommandResult
+
+_JOB = {"job_id": "abc123", "schedule": "*/5 * * * *", "command": "/usr/local/bin/run.sh", "summary": {}}
+
+
+class _CronRunner:
+    def __init__(self) -> None:
+        self.list_calls: list[str] = []
+        self.detail_calls = 0
+
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        if "cron_detail_" in remote_command:
+            self.detail_calls += 1
+            return CommandResult(0, json.dumps({"recent_logs": ["ok"], "daily_buckets": []}), "")
+        self.list_calls.append(host)
+        return CommandResult(0, json.dumps({"jobs": [_JOB], "errors": []}), "")
+
+
+def _config() -> AppConfig:
+    return AppConfig(
+        poll_interval_seconds=5,
+        servers=[
+            ServerConfig(name="server-a", ssh_host="<SSH_USER>@203.0.113.10"),
+            ServerConfig(name="server-b", ssh_host="<SSH_USER>@203.0.113.11"),
+        ],
+        sync=SyncConfig(),
+    )
+
+
+def test_cron_detail_reuses_cached_listing() -> None:
+    invalidate_cron_cache()
+    config = _config()
+    runner = _CronRunner()
+    collect_cron_jobs(config, runner)
+    assert len(runner.list_calls) == 2
+    detail = get_cron_job_detail(config, runner, "server-b", "abc123")
+    assert detail["recent_logs"] == ["ok"]
+    assert len(runner.list_calls) == 2
+    assert runner.detail_calls == 1
+
+
+def test_cron_detail_recollects_only_target_server_after_invalidate() -> None:
+    invalidate_cron_cache()
+    runner = _CronRunner()
+    get_cron_job_detail(_config(), runner, "server-a", "abc123")
+    assert runner.list_calls == ["<SSH_USER>@203.0.113.10"]
+
+
+class _TimedOutDetailRunner(_CronRunner):
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        if "cron_detail_" in remote_command:
+            payload = {"recent_logs": [], "errors": ["journalctl read for the last 24h timed out after 25s"]}
+            return CommandResult(0, json.dumps(payload), "")
+        return super().run_ssh(host, remote_command, timeout)
+
+
+def test_cron_detail_reports_log_read_timeout() -> None:
+    invalidate_cron_cache()
+    detail = get_cron_job_detail(_config(), _TimedOutDetailRunner(), "server-a", "abc123")
+    assert detail["error"] == "journalctl read for the last 24h timed out after 25s"
+    assert get_cron_job_detail(_config(), _CronRunner(), "server-a", "abc123")["error"] is None
+
+
+class _FreshHostRunner:
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        self.commands.append(remote_command)
+        if remote_command.startswith("test -f"):
+            return CommandResult(199, "", "")
+        return CommandResult(0, json.dumps({"jobs": [_JOB], "errors": []}), "")
+
+
+def test_cron_list_script_uploaded_once_when_missing_on_host() -> None:
+    runner = _FreshHostRunner()
+    payload = collect_cron_jobs(_config(), runner)
+    assert payload["servers"]["server-a"]["jobs"] == [_JOB]
+    probe, upload = runner.commands[:2]
+    assert len(probe) < 200
+    assert upload.startswith(f"mkdir -p {REMOTE_SCRIPT_DIR} && cat > ")
+    assert "import glob" in upload
+
+
+class _BarrierRunner:
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        self.barrier.wait()
+        return CommandResult(0, json.dumps({"jobs": [], "errors": []}), "")
+
+
+def test_collect_cron_jobs_queries_servers_concurrently() -> None:
+    payload = collect_cron_jobs(_config(), _BarrierRunner(parties=2))
+    assert list(payload["servers"]) == ["server-a", "server-b"]
+    assert all(item["error"] is None for item in payload["servers"].values())
@@ -9,6 +9,8 @@ def test_is_safe_output_path() -> None:
     assert not is_safe_output_path("relative/path.md")
     assert not is_safe_output_path("/root/files/../secret.txt")
     assert not is_safe_output_path("/root/files/image.png")
+    assert not is_safe_output_path("/root/files/reports.md/")
+    assert is_safe_output_path("/root/files/..hidden.md")
 
 
 def test_build_local_output_path() -> None:
@@ -16,3 +18,9 @@ def test_build_local_output_path() -> None:
     local = build_local_output_path(root, "server-a", "/root/files/reports/daily.md")
     assert str(local).startswith("/tmp/project/.cache/cron_outputs/")
     assert local.suffix == ".md"
+
+
+def test_build_local_output_path_slugs_server_name() -> None:
+    local = build_local_output_path(Path("/tmp/project"), "edge box #1", "/var/log/job.log")
+    assert local == Path("/tmp/project/.cache/cron_outputs/edge-box-1/var__log__job.log")
+    assert build_local_output_path(Path("/tmp/project"), "***", "/a.md").parent.name == "server"
@@ -26,3 +26,8 @@ def test_parse_system_cron_lines() -> None:
 def test_extract_output_hints_filters_non_text() -> None:
     hints = extract_output_hints("/bin/echo a > /tmp/a.bin 2> /tmp/err.log")
     assert hints == ["/tmp/err.log"]
+
+
+def test_extract_output_hints_dedupes_and_skips_dotfiles() -> None:
+    hints = extract_output_hints("/bin/run > /tmp/out.LOG 2>> /tmp/out.LOG 1> /var/.log")
+    assert hints == ["/tmp/out.LOG"]
@@ -25,3 +25,16 @@ def test_summarize_job_logs_unknown_when_no_match() -> None:
     assert summary["runs_7d"] == 0
     assert summary["errors_7d"] == 0
     assert summary["last_status"] == "unknown"
+
+
+def test_summarize_job_logs_last_status_follows_last_match_only() -> None:
+    job = {"command": "/usr/local/bin/backup.sh"}
+    logs = [
+        "Feb 27 01:00:00 host backup.sh[1]: traceback while copying",
+        "Feb 27 01:05:00 host sshd[2]: unrelated error",
+        "Feb 27 02:00:00 host backup.sh[3]: done",
+    ]
+    summary = summarize_job_logs(job, logs)
+    assert summary["runs_24h"] == summary["runs_7d"] == 2
+    assert summary["errors_24h"] == summary["errors_7d"] == 1
+    assert summary["last_status"] == "ok"
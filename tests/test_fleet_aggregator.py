@@ -16,6 +16,9 @@ def _config() -> AppConfig:
 def test_parse_disk_usage_percent() -> None:
     assert parse_disk_usage_percent("/dev/vda1 40G 34G 6.8G 84% /") == 84
     assert parse_disk_usage_percent("none") is None
+    assert parse_disk_usage_percent("Filesystem Size Used Avail Use% Mounted") is None
+    assert parse_disk_usage_percent("use=91%,mount=/data") is None
+    assert parse_disk_usage_percent("abc12% /dev/vda1 40G 34G 6.8G 84% /") == 84
 
 
 def test_build_fleet_overview_summary_and_risks() -> None:
@@ -1,14 +1,23 @@
+import re
+
 from app.config import AppConfig, ServerConfig, SyncConfig
 from app.fleet_aggregator import run_node_check
 from app.ssh_runner import CommandResult
 
 
 class FakeRunner:
+    def __init__(self, failing: tuple[str, ...] = ()) -> None:
+        self.failing = failing
+        self.calls = 0
+
     def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
         _ = timeout
-        if "echo ok" in remote_command:
+        self.calls += 1
+        if remote_command == "echo ok":
             return CommandResult(returncode=0, stdout="ok\n", stderr="")
-        return CommandResult(returncode=0, stdout="ok\n", stderr="")
+        names = re.findall(r"echo (\w+)=ok", remote_command)
+        lines = [f"{name}={'fail' if name in self.failing else 'ok'}" for name in names]
+        return CommandResult(returncode=0, stdout="\n".join(lines) + "\n", stderr="")
 
 
 def _config() -> AppConfig:
@@ -24,3 +33,15 @@ def test_run_node_check_returns_score_and_checks() -> None:
     assert payload["server_name"] == "server-a"
     assert payload["score"] == 100
     assert len(payload["checks"]) >= 5
+
+
+def test_run_node_check_batches_probes_into_one_call() -> None:
+    runner = FakeRunner(failing=("command_ss", "path_agents_dir"))
+    payload = run_node_check(_config(), runner, "server-a")
+    assert runner.calls == 2
+    by_name = {item["name"]: item for item in payload["checks"]}
+    assert len(by_name) == 10
+    assert by_name["command_ss"]["detail"] == "missing command"
+    assert by_name["path_agents_dir"]["detail"] == "missing directory"
+    assert by_name["permission_temp_write"]["ok"]
+    assert payload["score"] == 80
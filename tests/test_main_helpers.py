@@ -1,7 +1,33 @@
+import gzip
+import http.client
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+
 import pytest
 
-from app.config import AppConfig, ServerConfig, SyncConfig
-from app.main import _normalize_copy_skill_names, _resolve_sync_servers
+from app.config import AppConfig, SecurityConfig, ServerConfig, SyncConfig
+from app.main import (
+    ConsoleHandler,
+    PooledHTTPServer,
+    _accepts_gzip,
+    _build_batch_snapshot,
+    _build_server_index,
+    _encode_snapshot,
+    _etag_matches,
+    _idle_poll_interval,
+    _load_static,
+    _next_poll_delay,
+    _normalize_copy_skill_names,
+    _parse_session_cookie,
+    _read_json,
+    _public_config_bytes,
+    _resolve_sync_servers,
+    _safe_join_web,
+    _validate_body,
+)
 
 
 def _config(servers: list[ServerConfig]) -> AppConfig:
@@ -47,3 +73,198 @@ def test_resolve_sync_servers_supports_lookup_by_name() -> None:
     src, dst = _resolve_sync_servers(config, mode="one_way", source_server_input="s2", target_server_input="s1")
     assert src.name == "s2"
     assert dst.name == "s1"
+
+
+def test_resolve_sync_servers_uses_prebuilt_index() -> None:
+    servers = [
+        ServerConfig(name="s1", ssh_host="<SSH_USER>@203.0.113.10"),
+        ServerConfig(name="s2", ssh_host="<SSH_USER>@203.0.113.11"),
+    ]
+    index = _build_server_index(servers)
+    assert index["s1"] is index["<SSH_USER>@203.0.113.10"]
+    src, dst = _resolve_sync_servers(
+        _config(servers),
+        mode="one_way",
+        source_server_input="<SSH_USER>@203.0.113.10",
+        target_server_input="s2",
+        server_index=index,
+    )
+    assert (src.name, dst.name) == ("s1", "s2")
+
+
+def test_snapshot_etag_matches_conditional_header() -> None:
+    body, etag = _encode_snapshot({"servers": {}, "updated_at": "x"})
+    assert json.loads(body) == {"servers": {}, "updated_at": "x"}
+    assert _encode_snapshot({"servers": {}, "updated_at": "x"})[1] == etag
+    assert _etag_matches(etag, etag)
+    assert _etag_matches(f'"other", W/{etag}', etag)
+    assert _etag_matches("*", etag)
+    assert not _etag_matches("", etag)
+    assert not _etag_matches('"other"', etag)
+
+
+def test_public_config_bytes_redacts_secrets() -> None:
+    config = AppConfig(
+        poll_interval_seconds=5,
+        servers=[],
+        sync=SyncConfig(ssh_key_path="/keys/id"),
+        security=SecurityConfig(password="pw", operation_confirm_code="code"),
+    )
+    payload = json.loads(_public_config_bytes(config))
+    assert payload["sync"]["ssh_key_path"] == "***"
+    assert payload["security"]["password"] == "***"
+    assert payload["security"]["operation_confirm_code"] == "***"
+    assert config.security.password == "pw"
+
+
+def test_next_poll_delay_subtracts_elapsed_and_backs_off(monkeypatch) -> None:
+    monkeypatch.setattr("app.main.random.uniform", lambda low, high: 0.0)
+    assert _next_poll_delay(5, elapsed=2.0, failures=0) == 3.0
+    assert _next_poll_delay(5, elapsed=30.0, failures=0) == 1.0
+    assert _next_poll_delay(5, elapsed=0.0, failures=1) == 10.0
+    assert _next_poll_delay(5, elapsed=0.0, failures=20) == 60.0
+
+
+def test_idle_poll_interval_stretches_without_clients() -> None:
+    assert _idle_poll_interval(5, idle=30.0) == 5
+    assert _idle_poll_interval(5, idle=120.0) == 15.0
+    assert _idle_poll_interval(5, idle=36000.0) == 300.0
+    assert _idle_poll_interval(600, idle=36000.0) == 600
+
+
+def test_safe_join_web_serves_indexed_files_and_rejects_escape() -> None:
+    index_path = _safe_join_web("index.html")
+    assert index_path is not None and index_path.name == "index.html"
+    assert _safe_join_web("../config.example.yaml") is None
+
+
+def test_parse_session_cookie_picks_session_value() -> None:
+    assert _parse_session_cookie("") is None
+    assert _parse_session_cookie("theme=dark") is None
+    assert _parse_session_cookie("clawfleet_session=abc-_1") == "abc-_1"
+    assert _parse_session_cookie("theme=dark; clawfleet_session=abc; other=1") == "abc"
+    assert _parse_session_cookie("old_clawfleet_session=x") is None
+
+
+def test_validate_body_checks_required_and_optional_strings() -> None:
+    schema = (("server", True), ("prompt", False))
+    assert _validate_body({"server": "s1"}, schema) == ({"server": "s1", "prompt": None}, None)
+    assert _validate_body({"server": ""}, schema)[1] == "server must be non-empty string"
+    assert _validate_body({"server": "s1", "prompt": 3}, schema)[1] == "prompt must be string"
+
+
+def test_load_static_reuses_body_until_file_changes(tmp_path, monkeypatch) -> None:
+    page = tmp_path / "page.html"
+    page.write_text("<p>one</p>")
+    first = _load_static(page)
+    assert first is not None and first[0] == b"<p>one</p>"
+    assert _load_static(page) is first
+    page.write_text("<p>two!</p>")
+    assert _load_static(page) is first
+    monkeypatch.setattr("app.main.STATIC_REVALIDATE_SECONDS", 0.0)
+    second = _load_static(page)
+    assert second is not None and second[0] == b"<p>two!</p>" and second[1] != first[1]
+    assert _load_static(tmp_path / "missing.html") is None
+    assert _load_static(tmp_path) is None
+
+
+def _json_request(raw: bytes, length: int | None = None) -> SimpleNamespace:
+    size = len(raw) if length is None else length
+    return SimpleNamespace(headers={"Content-Length": str(size)}, rfile=io.BytesIO(raw))
+
+
+def test_read_json_parses_bytes_and_rejects_bad_bodies() -> None:
+    assert _read_json(_json_request('{"name": "café"}'.encode("utf-8"))) == {"name": "café"}
+    assert _read_json(_json_request(b"")) == {}
+    with pytest.raises(ValueError, match="Invalid JSON body"):
+        _read_json(_json_request(b"\xff{"))
+    with pytest.raises(ValueError, match="JSON body too large"):
+        _read_json(_json_request(b"{}", length=2 * 1024 * 1024))
+    # The scratch buffer is reused; a shorter body must not see stale bytes.
+    assert _read_json(_json_request(b'{"a": [1, 2, 3, 4, 5]}')) == {"a": [1, 2, 3, 4, 5]}
+    assert _read_json(_json_request(b'{"b": 1}')) == {"b": 1}
+    assert _read_json(_json_request(b'{"c": 1}', length=20)) == {"c": 1}
+
+
+def test_load_static_precompresses_large_assets(tmp_path) -> None:
+    small = tmp_path / "small.css"
+    small.write_text("body{}")
+    assert _load_static(small)[2] is None
+    script = tmp_path / "app.js"
+    script.write_text("console.log('clawfleet');\n" * 200)
+    body, etag, gzipped = _load_static(script)
+    assert gzipped is not None and gzipped[1] != etag
+    assert gzip.decompress(gzipped[0]) == body
+
+
+def test_accepts_gzip_honours_q_values() -> None:
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not _accepts_gzip("gzip;q=0")
+    assert not _accepts_gzip("br, deflate")
+    assert not _accepts_gzip("")
+
+
+def test_build_batch_snapshot_splices_snapshots_and_derives_etag() -> None:
+    (body, etag), error = _build_batch_snapshot(["/api/status", "/api/sync/run"])
+    assert error is None
+    responses = json.loads(body)["responses"]
+    assert [item["status"] for item in responses] == [200, 404]
+    assert set(responses[0]["body"]) >= {"servers", "updated_at"}
+    assert _build_batch_snapshot(["/api/status", "/api/sync/run"])[0][1] == etag
+    assert _build_batch_snapshot(["/api/status"])[0][1] != etag
+    assert _build_batch_snapshot([]) == (None, "at least one path is required")
+    assert _build_batch_snapshot(["/api/status"] * 33) == (None, "at most 32 paths per batch")
+
+
+def test_keepalive_connection_closes_while_others_wait_for_a_worker() -> None:
+    server = PooledHTTPServer(("127.0.0.1", 0), ConsoleHandler, max_workers=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        first = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        first.request("GET", "/api/version")
+        response = first.getresponse()
+        response.read()
+        assert response.getheader("Connection") is None
+        # Let the worker settle into waiting for the first connection's next request.
+        time.sleep(0.1)
+
+        second = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        second.connect()
+        for _ in range(50):
+            if server.connections_waiting:
+                break
+            time.sleep(0.01)
+        first.request("GET", "/api/version")
+        response = first.getresponse()
+        response.read()
+        assert response.getheader("Connection") == "close"
+
+        second.request("GET", "/api/version")
+        response = second.getresponse()
+        response.read()
+        assert response.status in {200, 401}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_idle_keepalive_connection_releases_its_worker(monkeypatch) -> None:
+    monkeypatch.setattr("app.main.KEEPALIVE_IDLE_SECONDS", 0.2)
+    server = PooledHTTPServer(("127.0.0.1", 0), ConsoleHandler, max_workers=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        idle = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        idle.request("GET", "/api/version")
+        idle.getresponse().read()
+
+        started = time.monotonic()
+        other = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        other.request("GET", "/api/version")
+        other.getresponse().read()
+        assert time.monotonic() - started < 2
+    finally:
+        server.shutdown()
+        server.server_close()
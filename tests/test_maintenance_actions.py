@@ -1,5 +1,7 @@
+import threading
+
 from app.config import AppConfig, ServerConfig, SyncConfig
-from app.maintenance_actions import run_backup
+from app.maintenance_actions import run_backup, run_update
 from app.ssh_runner import CommandResult
 
 
@@ -24,3 +26,20 @@ def test_run_backup_all_servers() -> None:
     assert payload["action"] == "backup"
     assert len(payload["servers"]) == 2
     assert payload["servers"]["server-a"]["ok"] is True
+
+
+class BarrierRunner:
+    """Only succeeds if both hosts are in flight at the same time."""
+
+    def __init__(self) -> None:
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def run_ssh(self, host: str, remote_command: str, timeout: int = 30) -> CommandResult:
+        self.barrier.wait()
+        return CommandResult(returncode=0, stdout=f"host={host}", stderr="")
+
+
+def test_run_update_fans_out_and_keeps_server_order() -> None:
+    payload = run_update(_config(), BarrierRunner(), server="all")  # type: ignore[arg-type]
+    assert list(payload["servers"]) == ["server-a", "server-b"]
+    assert payload["servers"]["server-b"]["stdout"] == "host=<SSH_USER>@203.0.113.11"
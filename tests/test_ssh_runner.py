@@ -0,0 +1,26 @@
+from app.ssh_runner import CommandResult, SSHRunner
+
+
+def test_ssh_options_are_built_once_and_copied() -> None:
+    runner = SSHRunner("/tmp/key")
+    options = runner.ssh_options()
+    assert options[-2:] == ["-i", "/tmp/key"]
+    assert "ControlMaster=auto" in options
+    options.append("-v")
+    assert "-v" not in runner.ssh_options()
+
+
+def test_close_masters_sends_exit_per_host(monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run_local(self, command: list[str], timeout: int = 60) -> CommandResult:
+        calls.append(command)
+        return CommandResult(returncode=255, stdout="", stderr="No ControlPath specified")
+
+    monkeypatch.setattr(SSHRunner, "run_local", fake_run_local)
+    thread = SSHRunner().close_masters(["claw-a", "claw-b"])
+    assert thread is not None
+    thread.join(timeout=5)
+    assert sorted(call[-3:] for call in calls) == [["-O", "exit", "claw-a"], ["-O", "exit", "claw-b"]]
+    assert SSHRunner(multiplex=False).close_masters(["claw-a"]) is None
+    assert SSHRunner().close_masters([]) is None
@@ -26,6 +26,16 @@
     return { response, payload };
   }
 
+  async function apiBatch(paths) {
+    // A GET, so the browser revalidates it with If-None-Match and reuses the cached body on 304.
+    const query = paths.map((path) => `path=${encodeURIComponent(path)}`).join("&");
+    const payload = await api(`/api/batch?${query}`);
+    return (payload.responses || []).map((item) => {
+      if (item.status !== 200) throw buildError(item.body, item.status);
+      return item.body;
+    });
+  }
+
   async function api(path, options) {
     const first = await rawApi(path, options);
     if (first.response.ok) return first.payload;
@@ -371,10 +381,7 @@
       let data;
       let runtimeData = { servers: {} };
       try {
-        const result = await Promise.all([
-          api("/api/status"),
-          api("/api/agent-runtime").catch((error) => ({ error: String(error), servers: {} })),
-        ]);
+        const result = await apiBatch(["/api/status", "/api/agent-runtime"]);
         data = result[0];
         runtimeData = result[1] || { servers: {} };
       } catch (error) {
@@ -1297,7 +1304,7 @@
       setStatus(statusNode, "正在加载混合云总览...");
       setStatus(alertStatusNode, "正在加载告警...");
       try {
-        const [fleet, alerts] = await Promise.all([api("/api/fleet/overview"), api("/api/alerts")]);
+        const [fleet, alerts] = await apiBatch(["/api/fleet/overview", "/api/alerts"]);
         const summary = fleet.summary || {};
         if (generatedNode) generatedNode.textContent = `更新时间：${fleet.generated_at || "-"}`;
         if (totalNode) totalNode.textContent = String(summary.total_nodes || 0);